@@ -1,7 +1,12 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models import F
+from django.db.models.functions import Mod
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
+
+EXP_PER_LEVEL = 100  # 레벨업에 필요한 경험치
 
 
 class UserProfile(models.Model):
@@ -25,19 +30,39 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"{self.user.username} - Level {self.level}"
 
+    @classmethod
+    def grant(cls, user_id, points=0, experience=0):
+        """
+        포인트/경험치를 UPDATE 한 번으로 더한다. 레벨업(100 경험치당 1레벨)도 같은 문장에서
+        level += (experience + exp) // 100, experience = (experience + exp) % 100 으로 계산하므로
+        동시에 여러 미션을 완료해도 값이 덮어써지지 않는다.
+        """
+        gained = F('experience') + experience
+        values = {
+            'total_points': F('total_points') + points,
+            'level': F('level') + gained / EXP_PER_LEVEL,   # 정수 나눗셈
+            'experience': Mod(gained, EXP_PER_LEVEL),
+            'updated_at': timezone.now(),
+        }
+        if not cls.objects.filter(user_id=user_id).update(**values):
+            # 프로필이 없던 사용자 (시그널 이전 가입자)
+            cls.objects.get_or_create(user_id=user_id)
+            cls.objects.filter(user_id=user_id).update(**values)
+
+    @classmethod
+    def grant_points(cls, user_id, points):
+        """포인트와 그 10%의 경험치를 함께 지급"""
+        cls.grant(user_id, points=points, experience=points // 10)
+
     def add_experience(self, exp):
         """경험치를 추가하고 레벨업 체크"""
-        self.experience += exp
-        # 레벨업 로직 (100 경험치당 1레벨)
-        while self.experience >= 100:
-            self.experience -= 100
-            self.level += 1
-        self.save()
+        self.grant(self.user_id, experience=exp)
+        self.refresh_from_db(fields=['level', 'experience', 'total_points', 'updated_at'])
 
     def add_points(self, points):
         """포인트 획득"""
-        self.total_points += points
-        self.add_experience(points // 10)  # 포인트의 10%를 경험치로
+        self.grant_points(self.user_id, points)
+        self.refresh_from_db(fields=['level', 'experience', 'total_points', 'updated_at'])
 
 
 @receiver(post_save, sender=User)
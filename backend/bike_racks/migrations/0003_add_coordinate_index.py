@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bike_racks', '0002_add_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bikerack',
+            index=models.Index(fields=['latitude', 'longitude'], name='bike_racks__latitud_880f1e_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 
+from geocode.querysets import GeoQuerySet
+
 class BikeRack(models.Model):
     자전거보관소명 = models.CharField(max_length=200)
     소재지도로명주소 = models.CharField(max_length=300, null=True, blank=True)
@@ -15,6 +17,13 @@ class BikeRack(models.Model):
     latitude = models.FloatField(blank=True, null=True)
     longitude = models.FloatField(blank=True, null=True)
 
+    objects = GeoQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["latitude", "longitude"]),
+        ]
+
     def save(self, *args, **kwargs):
         # 좌표가 없고 주소가 있으면 자동으로 geocoding
         if not self.latitude and not self.longitude:
@@ -13,4 +13,26 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from config import clients  # noqa: E402  (설정이 로드된 뒤 import)
+
+
+async def lifespan(receive, send):
+    """서버 시작 시 이벤트 루프를 등록하고, 종료 시 공유 httpx 클라이언트를 닫는다"""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            clients.register_loop()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await clients.close_async_client()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    await django_application(scope, receive, send)
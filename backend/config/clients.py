@@ -0,0 +1,269 @@
+"""
+외부 API 호출 공용 클라이언트.
+- 동기: 호스트별로 커넥션 풀을 가진 requests.Session 하나를 재사용 (keep-alive)
+- 비동기: ASGI 서버의 이벤트 루프(register_loop로 등록)에서는 httpx.AsyncClient 하나를 재사용.
+  WSGI/runserver처럼 요청마다 새 루프가 생기는 경우에는 동기 풀(request)을 스레드에서 쓴다.
+- 공통: connect/read 타임아웃, 지수 백오프 + jitter 재시도, 호스트별 지연 시간 지표
+"""
+import asyncio
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+
+class UpstreamMetrics:
+    """호스트별 요청 수/오류/재시도 횟수와 최근 지연 시간 (프로세스 기준)"""
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host):
+        stats = self._hosts.get(host)
+        if stats is None:
+            stats = self._hosts[host] = {
+                "requests": 0,
+                "errors": 0,
+                "retries": 0,
+                "latencies": deque(maxlen=self.window),
+            }
+        return stats
+
+    def record(self, host, elapsed, ok):
+        with self._lock:
+            stats = self._host(host)
+            stats["requests"] += 1
+            if not ok:
+                stats["errors"] += 1
+            stats["latencies"].append(elapsed)
+
+    def record_retry(self, host):
+        with self._lock:
+            self._host(host)["retries"] += 1
+
+    def snapshot(self):
+        result = {}
+        with self._lock:
+            for host, stats in self._hosts.items():
+                latencies = sorted(stats["latencies"])
+                result[host] = {
+                    "requests": stats["requests"],
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "latency_ms": {
+                        "p50": _percentile_ms(latencies, 0.5),
+                        "p95": _percentile_ms(latencies, 0.95),
+                        "max": _percentile_ms(latencies, 1.0),
+                    },
+                }
+        return result
+
+
+def _percentile_ms(values, q):
+    if not values:
+        return None
+    return round(values[min(len(values) - 1, int(q * len(values)))] * 1000, 1)
+
+
+metrics = UpstreamMetrics()
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(host):
+    """호스트별 공유 requests.Session (커넥션 풀 크기 HTTP_POOL_SIZE)"""
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=settings.HTTP_POOL_SIZE,
+                    max_retries=0,   # 재시도는 아래에서 백오프와 함께 직접 처리
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _sessions[host] = session
+    return session
+
+
+def backoff_delay(attempt, response_headers=None):
+    """attempt번째 재시도 전 대기 시간 (full jitter, 429의 Retry-After는 존중)"""
+    retry_after = (response_headers or {}).get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), settings.HTTP_BACKOFF_MAX)
+    return random.uniform(0, min(settings.HTTP_BACKOFF_MAX, settings.HTTP_BACKOFF * 2 ** attempt))
+
+
+def _should_retry(method, attempt, retries, status=None):
+    if method not in RETRY_METHODS or attempt >= retries:
+        return False
+    return status is None or status in RETRY_STATUSES
+
+
+def request(method, url, retries=None, **kwargs):
+    """
+    공유 세션으로 요청. 연결 오류/타임아웃과 429·5xx 응답은 GET/HEAD에 한해 재시도한다.
+    재시도를 다 써도 실패하면 마지막 응답을 반환하거나 마지막 예외를 그대로 올린다.
+    """
+    method = method.upper()
+    host = urlsplit(url).netloc
+    retries = settings.HTTP_RETRIES if retries is None else retries
+    kwargs.setdefault("timeout", (settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_TIMEOUT))
+    session = get_session(host)
+
+    attempt = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            metrics.record(host, time.perf_counter() - start, ok=False)
+            if not _should_retry(method, attempt, retries):
+                raise
+            delay = backoff_delay(attempt)
+        else:
+            ok = response.status_code < 500 and response.status_code != 429
+            metrics.record(host, time.perf_counter() - start, ok=ok)
+            if not _should_retry(method, attempt, retries, response.status_code):
+                return response
+            delay = backoff_delay(attempt, response.headers)
+            response.close()
+
+        metrics.record_retry(host)
+        time.sleep(delay)
+        attempt += 1
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+_async_clients = weakref.WeakKeyDictionary()
+_async_lock = threading.Lock()
+_long_lived_loops = weakref.WeakSet()
+
+# httpx.Response로 옮길 때 뺄 헤더 (requests가 이미 압축을 풀어 둠)
+_DECODED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def register_loop():
+    """현재 이벤트 루프를 프로세스 수명 동안 유지되는 루프로 등록 (ASGI 서버 시작 시)"""
+    _long_lived_loops.add(asyncio.get_running_loop())
+
+
+def has_async_pool():
+    """현재 루프에서 공유 httpx.AsyncClient를 써도 되는지 (등록된 루프인지)"""
+    try:
+        return asyncio.get_running_loop() in _long_lived_loops
+    except RuntimeError:
+        return False
+
+
+def get_async_client():
+    """
+    현재 이벤트 루프에서 공유하는 httpx.AsyncClient.
+    커넥션 풀은 루프에 묶이므로 register_loop로 등록된 루프에서만 쓴다 (ASGI 서버에서 프로세스당 하나).
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _long_lived_loops:
+        raise RuntimeError("등록되지 않은 이벤트 루프에서는 공유 AsyncClient를 쓸 수 없습니다")
+
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        with _async_lock:
+            client = _async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=httpx.Timeout(
+                        settings.HTTP_TIMEOUT, connect=settings.HTTP_CONNECT_TIMEOUT
+                    ),
+                    limits=httpx.Limits(
+                        max_connections=settings.HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE,
+                    ),
+                )
+                _async_clients[loop] = client
+    return client
+
+
+async def close_async_client():
+    """현재 루프의 공유 클라이언트를 닫는다 (ASGI 종료 처리/테스트용)"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _request_as_httpx(method, url, retries=None, **kwargs):
+    """request()를 부르고 결과/예외를 httpx 형식으로 바꾼다 (arequest의 동기 풀 경로)"""
+    try:
+        response = request(method, url, retries=retries, **kwargs)
+    except requests.Timeout as e:
+        raise httpx.TimeoutException(str(e)) from e
+    except requests.ConnectionError as e:
+        raise httpx.ConnectError(str(e)) from e
+
+    headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _DECODED_HEADERS]
+    return httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=response.content,
+        request=httpx.Request(method, response.url),
+    )
+
+
+async def arequest(method, url, retries=None, **kwargs):
+    """
+    request()의 비동기 버전 (같은 재시도/지표 규칙, 반환은 httpx.Response).
+    등록된 루프가 아니면 요청이 끝날 때 루프도 사라지므로, 동기 풀을 스레드에서 쓴다.
+    """
+    method = method.upper()
+    if not has_async_pool():
+        return await sync_to_async(_request_as_httpx, thread_sensitive=False)(
+            method, url, retries=retries, **kwargs
+        )
+
+    host = urlsplit(url).netloc
+    retries = settings.HTTP_RETRIES if retries is None else retries
+    client = get_async_client()
+
+    attempt = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            metrics.record(host, time.perf_counter() - start, ok=False)
+            if not _should_retry(method, attempt, retries):
+                raise
+            delay = backoff_delay(attempt)
+        else:
+            ok = response.status_code < 500 and response.status_code != 429
+            metrics.record(host, time.perf_counter() - start, ok=ok)
+            if not _should_retry(method, attempt, retries, response.status_code):
+                return response
+            delay = backoff_delay(attempt, response.headers)
+
+        metrics.record_retry(host)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def aget(url, **kwargs):
+    return await arequest("GET", url, **kwargs)
@@ -0,0 +1,73 @@
+import base64
+import binascii
+import json
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class OptInCursorPagination(CursorPagination):
+    """
+    cursor 또는 page_size 파라미터가 있을 때만 쓰는 커서 페이지네이션.
+    없으면 기존처럼 전체 목록(JSON 배열)을 그대로 돌려준다. (기존 앱 호환)
+    """
+
+    ordering = '-id'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+
+def parse_fields(request, param='fields'):
+    """
+    ?fields=id,name,mission.title → {'id': None, 'name': None, 'mission': {'title': None}}
+    없으면 None (모든 필드)
+    """
+    raw = request.query_params.get(param)
+    if not raw:
+        return None
+
+    tree = {}
+    for path in raw.split(','):
+        parts = [part.strip() for part in path.split('.') if part.strip()]
+        if not parts:
+            continue
+        node = tree
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is None:
+                # 'mission'과 'mission.title'이 함께 오면 상위 전체를 우선
+                if part in node:
+                    break
+                child = node[part] = {}
+            node = child
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+def select_fields(data, fields):
+    """parse_fields 결과에 있는 키만 남긴다 (모르는 필드는 무시)"""
+    if fields is None or not isinstance(data, dict):
+        return data
+    return {key: select_fields(data[key], sub) for key, sub in fields.items() if key in data}
+
+
+def encode_cursor(value):
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+
+def decode_cursor(token):
+    """encode_cursor의 반대. 잘못된 값이면 ValueError"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (TypeError, UnicodeError, json.JSONDecodeError, binascii.Error) as e:
+        raise ValueError(f'잘못된 cursor: {e}')
+
+
+def next_page_url(request, cursor_value, param='cursor'):
+    return replace_query_param(request.build_absolute_uri(), param, encode_cursor(cursor_value))
@@ -150,4 +150,42 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # API Keys
 KAKAO_API_KEY = os.getenv('KAKAO_API_KEY', '')
+KAKAO_RATE_LIMIT = float(os.getenv('KAKAO_RATE_LIMIT', 10))  # 초당 최대 요청 수
 OPENWEATHER_API_KEY = os.getenv('OPENWEATHER_API_KEY', '')
+
+# Geocode 캐시 (초 단위 TTL)
+GEOCODE_CACHE_TTL = int(os.getenv('GEOCODE_CACHE_TTL', 60 * 60 * 24 * 90))
+GEOCODE_NEGATIVE_TTL = int(os.getenv('GEOCODE_NEGATIVE_TTL', 60 * 60 * 24 * 7))
+GEOCODE_MEMORY_CACHE_SIZE = int(os.getenv('GEOCODE_MEMORY_CACHE_SIZE', 4096))
+
+# 응답 캐시 (기본: 프로세스 메모리. 여러 프로세스가 공유하려면 Redis/Memcached로 교체)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'gong-data',
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', 10000))},
+    }
+}
+
+# 주변 조회 응답 캐시: 좌표를 격자(도 단위, 0.0002 ≈ 20m)에 맞춰 키로 사용
+NEARBY_CACHE_GRID_DEG = float(os.getenv('NEARBY_CACHE_GRID_DEG', 0.0002))
+NEARBY_CACHE_TTL = int(os.getenv('NEARBY_CACHE_TTL', 300))
+
+# 날씨 캐시: 위경도를 타일(도 단위, 0.02 ≈ 2km)로 묶고, TTL이 지나면 STALE 동안 예전 값을 주며 갱신
+WEATHER_TILE_DEG = float(os.getenv('WEATHER_TILE_DEG', 0.02))
+WEATHER_CACHE_TTL = int(os.getenv('WEATHER_CACHE_TTL', 600))
+WEATHER_STALE_TTL = int(os.getenv('WEATHER_STALE_TTL', 1800))
+WEATHER_TIMEOUT = float(os.getenv('WEATHER_TIMEOUT', 5))
+
+# 외부 API 호출 공통 설정 (config/clients.py)
+# 타임아웃(초): HTTP_TIMEOUT은 읽기, HTTP_CONNECT_TIMEOUT은 연결
+HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', 5))
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 3))
+# 재시도: 최대 횟수, 백오프 기준/최대 대기(초, 2배씩 늘리며 0~대기 사이 무작위)
+HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', 2))
+HTTP_BACKOFF = float(os.getenv('HTTP_BACKOFF', 0.2))
+HTTP_BACKOFF_MAX = float(os.getenv('HTTP_BACKOFF_MAX', 5))
+# 커넥션 풀: 동기 세션은 호스트별 HTTP_POOL_SIZE, 비동기 클라이언트는 전체 HTTP_MAX_CONNECTIONS
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 20))
+HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', 200))
+HTTP_MAX_KEEPALIVE = int(os.getenv('HTTP_MAX_KEEPALIVE', 50))
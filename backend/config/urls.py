@@ -17,6 +17,8 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+from .views import upstream_metrics
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/auth/", include("accounts.urls")),
@@ -25,4 +27,5 @@ urlpatterns = [
     path("api/", include("weather.urls")),
     path("api/", include("places.urls")),
     path("api/geocode/", include("geocode.urls")),
+    path("api/metrics/upstream/", upstream_metrics, name="upstream_metrics"),
 ]
@@ -0,0 +1,12 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from .clients import metrics
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def upstream_metrics(request):
+    """외부 API 호스트별 요청/오류/재시도 횟수와 최근 지연 시간 (관리자용, 이 프로세스 기준)"""
+    return Response(metrics.snapshot())
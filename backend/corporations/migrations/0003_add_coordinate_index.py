@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('corporations', '0002_add_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='corporation',
+            index=models.Index(fields=['latitude', 'longitude'], name='corporation_latitud_6e9132_idx'),
+        ),
+    ]
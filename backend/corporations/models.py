@@ -1,5 +1,7 @@
 from django.db import models
 
+from geocode.querysets import GeoQuerySet
+
 class Corporation(models.Model):
     실과명 = models.CharField(max_length=100, blank=True, null=True)
     법인종류 = models.CharField(max_length=100, blank=True, null=True)
@@ -17,6 +19,13 @@ class Corporation(models.Model):
     latitude = models.FloatField(blank=True, null=True)
     longitude = models.FloatField(blank=True, null=True)
 
+    objects = GeoQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["latitude", "longitude"]),
+        ]
+
     def save(self, *args, **kwargs):
         # 좌표가 없고 주소가 있으면 자동으로 geocoding
         if self.법인주소 and not self.latitude and not self.longitude:
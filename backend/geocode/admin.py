@@ -1,3 +1,8 @@
 from django.contrib import admin
+from .models import GeocodeCache
 
-# Register your models here.
+
+@admin.register(GeocodeCache)
+class GeocodeCacheAdmin(admin.ModelAdmin):
+    list_display = ('address', 'latitude', 'longitude', 'expires_at')
+    search_fields = ('address',)
@@ -0,0 +1,64 @@
+import queue
+import threading
+
+from django.db import close_old_connections
+
+from .signals import coordinates_updated
+from .utils import geocode_address
+
+
+class BackfillQueue:
+    """
+    좌표가 비어 있는 행을 요청 처리와 분리해 백그라운드 스레드에서 geocoding한다.
+    같은 행은 처리 중이면 다시 넣지 않는다.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def schedule(self, obj, address):
+        if not address or obj.pk is None:
+            return
+
+        key = (obj._meta.label, obj.pk)
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+            self._queue.put((type(obj), obj.pk, address, key))
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="geocode-backfill", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            model, pk, address, key = self._queue.get()
+            try:
+                close_old_connections()
+                lat, lon = geocode_address(address)
+                if lat and lon:
+                    # 그 사이에 다른 곳에서 좌표를 채웠다면 덮어쓰지 않는다
+                    updated = model._default_manager.filter(pk=pk, latitude__isnull=True).update(
+                        latitude=lat, longitude=lon
+                    )
+                    if updated:
+                        coordinates_updated.send(sender=model)
+            except Exception as e:
+                print(f"Geocoding 백필 실패 ({key}): {e}")
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                self._queue.task_done()
+                close_old_connections()
+
+
+backfill_queue = BackfillQueue()
+
+
+def schedule_backfill(obj, address):
+    """obj의 좌표를 백그라운드에서 채우도록 예약 (즉시 반환)"""
+    backfill_queue.schedule(obj, address)
@@ -0,0 +1,111 @@
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def normalize_address(address):
+    """캐시 키용 주소 정규화 (유니코드 NFC, 앞뒤/연속 공백 정리)"""
+    if not address:
+        return ""
+    address = unicodedata.normalize("NFC", str(address))
+    return " ".join(address.split())[:300]
+
+
+class LRUCache:
+    """만료 시각을 함께 들고 있는 스레드 안전 LRU (프로세스 메모리)"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._data[key] = (value, time.time() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class GeocodeResultCache:
+    """
+    메모리 LRU → DB(GeocodeCache) 순서로 조회하는 geocode 결과 캐시.
+    값은 (lat, lon) 이며, 찾을 수 없는 주소는 (None, None)으로 짧은 TTL 동안 저장한다.
+    """
+
+    def __init__(self):
+        self.memory = LRUCache(settings.GEOCODE_MEMORY_CACHE_SIZE)
+
+    def get(self, key):
+        """캐시된 (lat, lon)을 반환. 없거나 만료됐으면 None"""
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+
+        from .models import GeocodeCache
+
+        entry = GeocodeCache.objects.filter(address=key, expires_at__gt=timezone.now()).first()
+        if entry is None:
+            return None
+
+        value = (entry.latitude, entry.longitude)
+        remaining = (entry.expires_at - timezone.now()).total_seconds()
+        self.memory.set(key, value, remaining)
+        return value
+
+    def set(self, key, lat, lon):
+        self.set_many([(key, lat, lon)])
+
+    def set_many(self, results):
+        """[(key, lat, lon), ...]을 한 번의 upsert로 저장"""
+        from .models import GeocodeCache
+
+        now = timezone.now()
+        entries = {}
+        for key, lat, lon in results:
+            if lat is None or lon is None:
+                lat = lon = None
+                ttl = settings.GEOCODE_NEGATIVE_TTL
+            else:
+                ttl = settings.GEOCODE_CACHE_TTL
+
+            entries[key] = GeocodeCache(
+                address=key,
+                latitude=lat,
+                longitude=lon,
+                expires_at=now + timedelta(seconds=ttl),
+                updated_at=now,
+            )
+            self.memory.set(key, (lat, lon), ttl)
+
+        if entries:
+            GeocodeCache.objects.bulk_create(
+                entries.values(),
+                update_conflicts=True,
+                unique_fields=["address"],
+                update_fields=["latitude", "longitude", "expires_at", "updated_at"],
+            )
+
+
+geocode_cache = GeocodeResultCache()
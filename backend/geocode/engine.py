@@ -0,0 +1,228 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Q
+
+from .cache import geocode_cache, normalize_address
+from .signals import coordinates_updated
+from .utils import request_geocode
+
+
+class GeocodeTarget:
+    """geocoding 대상 모델 정의 (주소 필드는 앞에서부터 처음 값이 있는 것을 사용)"""
+
+    def __init__(self, key, model_label, address_fields, label_field, aliases=()):
+        self.key = key
+        self.model_label = model_label
+        self.address_fields = address_fields
+        self.label_field = label_field
+        self.aliases = (key,) + tuple(aliases)
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    def address_of(self, obj):
+        for field in self.address_fields:
+            value = getattr(obj, field)
+            if value:
+                return value
+        return None
+
+    def pending(self):
+        """좌표가 없고 주소가 하나라도 있는 행"""
+        has_address = Q()
+        for field in self.address_fields:
+            has_address |= Q(**{f"{field}__isnull": False}) & ~Q(**{field: ""})
+
+        return (
+            self.model._default_manager
+            .filter(latitude__isnull=True, longitude__isnull=True)
+            .filter(has_address)
+            .only("pk", self.label_field, *self.address_fields)
+            .order_by("pk")
+        )
+
+
+TARGETS = [
+    GeocodeTarget("corporations", "corporations.Corporation", ("법인주소",), "법인명칭"),
+    GeocodeTarget("bike_racks", "bike_racks.BikeRack", ("소재지도로명주소", "소재지지번주소"), "자전거보관소명"),
+    GeocodeTarget("places", "places.Place", ("address",), "name"),
+    GeocodeTarget("outdoor", "main.OutdoorEquipment", ("address",), "name",
+                  aliases=("outdoorequipment", "outdoor_equipment")),
+    GeocodeTarget("sports", "main.SportsFacility", ("address",), "place",
+                  aliases=("sportsfacility", "sports_facility")),
+]
+
+
+def get_targets(name=None):
+    """--model 값에 맞는 대상 목록 (없으면 전체)"""
+    if not name:
+        return list(TARGETS)
+    return [target for target in TARGETS if name in target.aliases]
+
+
+class TokenBucket:
+    """초당 rate개씩 토큰이 차는 스레드 안전 요청 속도 제한기"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class Checkpoint:
+    """대상별로 마지막으로 반영한 pk를 JSON 파일에 기록 (중단 후 이어서 실행용)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.data = json.load(f)
+
+    def get(self, key):
+        return self.data.get(key, 0)
+
+    def set(self, key, pk):
+        self.data[key] = pk
+        self._write()
+
+    def clear(self, key):
+        if self.data.pop(key, None) is not None:
+            self._write()
+
+    def _write(self):
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+
+class GeocodeEngine:
+    """
+    주소를 여러 스레드로 동시에 geocoding하고, 배치 단위로 bulk_update 후 체크포인트를 남긴다.
+    워커 스레드는 HTTP 요청만 하고(TokenBucket으로 속도 제한),
+    캐시 조회/저장과 DB 반영은 모두 실행 스레드에서 배치로 처리한다. (SQLite 쓰기 잠금 회피)
+    """
+
+    def __init__(self, rate, workers=8, batch_size=200, checkpoint=None, log=print):
+        self.bucket = TokenBucket(rate)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.checkpoint = checkpoint or Checkpoint(None)
+        self.log = log
+
+    def _request(self, key):
+        self.bucket.acquire()
+        try:
+            return request_geocode(key), None
+        except Exception as e:
+            return None, e
+
+    def geocode_many(self, executor, addresses):
+        """
+        주소 목록을 [((lat, lon), error), ...]로 변환.
+        캐시에 있는 주소는 바로 쓰고, 나머지 고유 주소만 API로 요청한다.
+        """
+        keys = [normalize_address(address) for address in addresses]
+
+        resolved = {}
+        misses = []
+        for key in dict.fromkeys(keys):
+            cached = geocode_cache.get(key)
+            if cached is not None:
+                resolved[key] = (cached, None)
+            else:
+                misses.append(key)
+
+        new_entries = []
+        for key, (result, error) in zip(misses, executor.map(self._request, misses)):
+            if error is not None or result is None:
+                # 요청 오류/HTTP 에러는 캐시하지 않는다
+                resolved[key] = ((None, None), error or "API 에러")
+            else:
+                resolved[key] = (result, None)
+                new_entries.append((key, *result))
+
+        geocode_cache.set_many(new_entries)
+        return [resolved[key] for key in keys]
+
+    def run(self, target, limit=None):
+        """target 하나를 처리하고 (성공, 실패) 개수를 반환"""
+        queryset = target.pending()
+        last_pk = self.checkpoint.get(target.key)
+        if last_pk:
+            queryset = queryset.filter(pk__gt=last_pk)
+            self.log(f"{target.key}: pk {last_pk} 이후부터 이어서 처리합니다.")
+
+        total = queryset.count()
+        if limit:
+            total = min(total, limit)
+        self.log(f"총 {total}개의 {target.model.__name__}을(를) 처리합니다.")
+
+        success_count = 0
+        fail_count = 0
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while done < total:
+                batch = list(queryset.filter(pk__gt=last_pk)[:min(self.batch_size, total - done)])
+                if not batch:
+                    break
+
+                addresses = [target.address_of(obj) for obj in batch]
+                results = self.geocode_many(executor, addresses)
+
+                updated = []
+                for obj, address, ((lat, lon), error) in zip(batch, addresses, results):
+                    label = getattr(obj, target.label_field)
+                    if error is not None:
+                        fail_count += 1
+                        self.log(f"오류: {label} - {error}")
+                    elif lat and lon:
+                        obj.latitude = lat
+                        obj.longitude = lon
+                        updated.append(obj)
+                    else:
+                        fail_count += 1
+                        self.log(f"실패: {label} - {address}")
+
+                with transaction.atomic():
+                    target.model._default_manager.bulk_update(updated, ["latitude", "longitude"])
+                if updated:
+                    coordinates_updated.send(sender=target.model)
+
+                success_count += len(updated)
+                done += len(batch)
+                last_pk = batch[-1].pk
+                self.checkpoint.set(target.key, last_pk)
+                self.log(f"[{done}/{total}] 성공 {success_count}, 실패 {fail_count}")
+
+        # 끝까지 처리했으면 다음 실행은 처음부터 (실패 건은 negative 캐시로 싸게 재확인)
+        if done >= total and not limit:
+            self.checkpoint.clear(target.key)
+
+        return success_count, fail_count
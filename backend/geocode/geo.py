@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371  # km
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    두 좌표(위도/경도) 사이의 거리(km)를 반환.
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def haversine_many(lat, lon, lats, lons):
+    """
+    한 좌표(lat, lon)에서 좌표 배열(lats, lons)까지의 거리(km)를 한 번에 계산.
+    반환: lats와 같은 길이의 float64 ndarray
+    """
+    lats = np.radians(np.asarray(lats, dtype=np.float64))
+    lons = np.radians(np.asarray(lons, dtype=np.float64))
+    lat = math.radians(lat)
+    lon = math.radians(lon)
+
+    a = np.sin((lats - lat) / 2) ** 2 + math.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+    # 부동소수 오차로 1을 살짝 넘는 경우 방지
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def top_k(distances, k):
+    """
+    distances에서 가장 작은 k개의 인덱스를 가까운 순으로 반환.
+    전체 정렬 대신 argpartition으로 k개만 골라 그 안에서만 정렬한다.
+    """
+    distances = np.asarray(distances)
+    n = len(distances)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        return np.argsort(distances, kind="stable")
+
+    idx = np.argpartition(distances, k - 1)[:k]
+    return idx[np.argsort(distances[idx], kind="stable")]
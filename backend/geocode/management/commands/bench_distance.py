@@ -0,0 +1,70 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from geocode.geo import haversine, haversine_many, top_k
+
+
+class Command(BaseCommand):
+    help = '행 단위 하버사인 루프와 배열 하버사인(haversine_many + top_k)의 속도를 비교합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--points',
+            type=int,
+            default=100000,
+            help='무작위로 만들 좌표 개수',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=5,
+            help='가까운 순으로 뽑을 개수',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='반복 측정 횟수 (가장 빠른 값 사용)',
+        )
+
+    def handle(self, *args, **options):
+        n = options['points']
+        limit = options['limit']
+        repeat = options['repeat']
+
+        # 천안 주변에 흩뿌린 좌표
+        rng = random.Random(0)
+        lats = [36.8 + rng.uniform(-0.5, 0.5) for _ in range(n)]
+        lons = [127.1 + rng.uniform(-0.5, 0.5) for _ in range(n)]
+        lat, lon = 36.81, 127.12
+
+        def loop():
+            results = []
+            for p_lat, p_lon in zip(lats, lons):
+                results.append(haversine(lat, lon, p_lat, p_lon))
+            return sorted(range(n), key=results.__getitem__)[:limit]
+
+        def vectorized():
+            return list(top_k(haversine_many(lat, lon, lats, lons), limit))
+
+        loop_sec = self.measure(loop, repeat)
+        vec_sec = self.measure(vectorized, repeat)
+
+        if loop() != vectorized():
+            self.stdout.write(self.style.WARNING('두 방식의 결과 순서가 다릅니다.'))
+
+        self.stdout.write(f'좌표 {n}개, 상위 {limit}개')
+        self.stdout.write(f'  행 단위 루프 + 정렬       : {loop_sec * 1000:.2f} ms')
+        self.stdout.write(f'  haversine_many + top_k : {vec_sec * 1000:.2f} ms')
+        self.stdout.write(self.style.SUCCESS(f'속도 향상: {loop_sec / vec_sec:.1f}배'))
+
+    def measure(self, func, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
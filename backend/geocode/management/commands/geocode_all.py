@@ -1,14 +1,13 @@
-import time
-from django.core.management.base import BaseCommand
-from corporations.models import Corporation
-from bike_racks.models import BikeRack
-from places.models import Place
-from main.models import OutdoorEquipment, SportsFacility
-from geocode.utils import geocode_address
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from geocode.engine import Checkpoint, GeocodeEngine, get_targets
 
 
 class Command(BaseCommand):
-    help = '주소를 경도/위도 좌표로 변환합니다'
+    help = '주소를 경도/위도 좌표로 변환합니다 (동시 요청 + 속도 제한 + 이어서 실행)'
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -16,220 +15,72 @@ class Command(BaseCommand):
             type=str,
             help='특정 모델만 처리 (corporations, bike_racks, places, outdoor, sports)',
         )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=settings.KAKAO_RATE_LIMIT,
+            help='초당 최대 API 요청 수',
+        )
         parser.add_argument(
             '--delay',
             type=float,
-            default=0.1,
-            help='API 요청 사이의 지연 시간 (초)',
+            help='API 요청 사이의 최소 간격 (초). 지정하면 --rate 대신 1/delay를 사용',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='동시에 요청하는 스레드 수',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='bulk_update 및 체크포인트 저장 단위',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='모델별 최대 처리 개수 (테스트용)',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            default=os.path.join(settings.BASE_DIR, 'geocode_checkpoint.json'),
+            help='진행 상황 체크포인트 파일 경로',
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='체크포인트를 무시하고 처음부터 처리',
         )
 
     def handle(self, *args, **options):
-        model_name = options.get('model')
-        delay = options.get('delay')
-
-        if not model_name or model_name == 'corporations':
-            self.geocode_corporations(delay)
-
-        if not model_name or model_name == 'bike_racks':
-            self.geocode_bike_racks(delay)
-
-        if not model_name or model_name == 'places':
-            self.geocode_places(delay)
-
-        if not model_name or model_name in ('outdoor', 'outdoorequipment', 'outdoor_equipment'):
-            self.geocode_outdoor_equipment(delay)
-
-        if not model_name or model_name in ('sports', 'sportsfacility', 'sports_facility'):
-            self.geocode_sports_facility(delay)
-
-        self.stdout.write(self.style.SUCCESS('Geocoding 완료!'))
-
-    def geocode_corporations(self, delay):
-        self.stdout.write('Corporation 모델 geocoding 시작...')
-        corporations = Corporation.objects.filter(
-            latitude__isnull=True,
-            longitude__isnull=True,
-            법인주소__isnull=False
-        ).exclude(법인주소='')
-
-        total = corporations.count()
-        self.stdout.write(f'총 {total}개의 Corporation을 처리합니다.')
-
-        success_count = 0
-        fail_count = 0
-
-        for idx, corp in enumerate(corporations, 1):
-            address = corp.법인주소
-            if not address:
-                continue
-
-            try:
-                lat, lon = geocode_address(address)
-                if lat and lon:
-                    corp.latitude = lat
-                    corp.longitude = lon
-                    corp.save()
-                    success_count += 1
-                    self.stdout.write(f'[{idx}/{total}] 성공: {corp.법인명칭} - {address}')
-                else:
-                    fail_count += 1
-                    self.stdout.write(self.style.WARNING(f'[{idx}/{total}] 실패: {corp.법인명칭} - {address}'))
-            except Exception as e:
-                fail_count += 1
-                self.stdout.write(self.style.ERROR(f'[{idx}/{total}] 오류: {corp.법인명칭} - {str(e)}'))
-
-            time.sleep(delay)
-
-        self.stdout.write(self.style.SUCCESS(f'Corporation: 성공 {success_count}, 실패 {fail_count}'))
-
-    def geocode_bike_racks(self, delay):
-        self.stdout.write('BikeRack 모델 geocoding 시작...')
-        bike_racks = BikeRack.objects.filter(
-            latitude__isnull=True,
-            longitude__isnull=True
+        targets = get_targets(options.get('model'))
+        if not targets:
+            raise CommandError(f"알 수 없는 모델: {options['model']}")
+
+        rate = options['rate']
+        if options.get('delay'):
+            rate = 1 / options['delay']
+
+        checkpoint = Checkpoint(options['checkpoint'])
+        engine = GeocodeEngine(
+            rate=rate,
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+            checkpoint=checkpoint,
+            log=self.stdout.write,
         )
 
-        total = bike_racks.count()
-        self.stdout.write(f'총 {total}개의 BikeRack을 처리합니다.')
-
-        success_count = 0
-        fail_count = 0
-
-        for idx, rack in enumerate(bike_racks, 1):
-            # 도로명 주소 우선, 없으면 지번 주소 사용
-            address = rack.소재지도로명주소 or rack.소재지지번주소
-            if not address:
-                continue
-
-            try:
-                lat, lon = geocode_address(address)
-                if lat and lon:
-                    rack.latitude = lat
-                    rack.longitude = lon
-                    rack.save()
-                    success_count += 1
-                    self.stdout.write(f'[{idx}/{total}] 성공: {rack.자전거보관소명} - {address}')
-                else:
-                    fail_count += 1
-                    self.stdout.write(self.style.WARNING(f'[{idx}/{total}] 실패: {rack.자전거보관소명} - {address}'))
-            except Exception as e:
-                fail_count += 1
-                self.stdout.write(self.style.ERROR(f'[{idx}/{total}] 오류: {rack.자전거보관소명} - {str(e)}'))
-
-            time.sleep(delay)
-
-        self.stdout.write(self.style.SUCCESS(f'BikeRack: 성공 {success_count}, 실패 {fail_count}'))
-
-    def geocode_places(self, delay):
-        self.stdout.write('Place 모델 geocoding 시작...')
-        places = Place.objects.filter(
-            latitude__isnull=True,
-            longitude__isnull=True,
-            address__isnull=False
-        ).exclude(address='')
-
-        total = places.count()
-        self.stdout.write(f'총 {total}개의 Place를 처리합니다.')
-
-        success_count = 0
-        fail_count = 0
-
-        for idx, place in enumerate(places, 1):
-            address = place.address
-            if not address:
-                continue
-
-            try:
-                lat, lon = geocode_address(address)
-                if lat and lon:
-                    place.latitude = lat
-                    place.longitude = lon
-                    place.save()
-                    success_count += 1
-                    self.stdout.write(f'[{idx}/{total}] 성공: {place.name} - {address}')
-                else:
-                    fail_count += 1
-                    self.stdout.write(self.style.WARNING(f'[{idx}/{total}] 실패: {place.name} - {address}'))
-            except Exception as e:
-                fail_count += 1
-                self.stdout.write(self.style.ERROR(f'[{idx}/{total}] 오류: {place.name} - {str(e)}'))
-
-            time.sleep(delay)
+        for target in targets:
+            if options['reset']:
+                checkpoint.clear(target.key)
 
-        self.stdout.write(self.style.SUCCESS(f'Place: 성공 {success_count}, 실패 {fail_count}'))
+            self.stdout.write(f'{target.model.__name__} 모델 geocoding 시작...')
+            success_count, fail_count = engine.run(target, limit=options.get('limit'))
+            self.stdout.write(self.style.SUCCESS(
+                f'{target.model.__name__}: 성공 {success_count}, 실패 {fail_count}'
+            ))
 
-    def geocode_outdoor_equipment(self, delay):
-        self.stdout.write('OutdoorEquipment 모델 geocoding 시작...')
-        equipments = OutdoorEquipment.objects.filter(
-            latitude__isnull=True,
-            longitude__isnull=True,
-            address__isnull=False
-        ).exclude(address='')
-
-        total = equipments.count()
-        self.stdout.write(f'총 {total}개의 OutdoorEquipment을 처리합니다.')
-
-        success_count = 0
-        fail_count = 0
-
-        for idx, equipment in enumerate(equipments, 1):
-            address = equipment.address
-            if not address:
-                continue
-
-            try:
-                lat, lon = geocode_address(address)
-                if lat and lon:
-                    equipment.latitude = lat
-                    equipment.longitude = lon
-                    equipment.save()
-                    success_count += 1
-                    self.stdout.write(f'[{idx}/{total}] 성공: {equipment.name} - {address}')
-                else:
-                    fail_count += 1
-                    self.stdout.write(self.style.WARNING(f'[{idx}/{total}] 실패: {equipment.name} - {address}'))
-            except Exception as e:
-                fail_count += 1
-                self.stdout.write(self.style.ERROR(f'[{idx}/{total}] 오류: {equipment.name} - {str(e)}'))
-
-            time.sleep(delay)
-
-        self.stdout.write(self.style.SUCCESS(f'OutdoorEquipment: 성공 {success_count}, 실패 {fail_count}'))
-
-    def geocode_sports_facility(self, delay):
-        self.stdout.write('SportsFacility 모델 geocoding 시작...')
-        facilities = SportsFacility.objects.filter(
-            latitude__isnull=True,
-            longitude__isnull=True,
-            address__isnull=False
-        ).exclude(address='')
-
-        total = facilities.count()
-        self.stdout.write(f'총 {total}개의 SportsFacility를 처리합니다.')
-
-        success_count = 0
-        fail_count = 0
-
-        for idx, facility in enumerate(facilities, 1):
-            address = facility.address
-            if not address:
-                continue
-
-            try:
-                lat, lon = geocode_address(address)
-                if lat and lon:
-                    facility.latitude = lat
-                    facility.longitude = lon
-                    facility.save()
-                    success_count += 1
-                    self.stdout.write(f'[{idx}/{total}] 성공: {facility.place} - {address}')
-                else:
-                    fail_count += 1
-                    self.stdout.write(self.style.WARNING(f'[{idx}/{total}] 실패: {facility.place} - {address}'))
-            except Exception as e:
-                fail_count += 1
-                self.stdout.write(self.style.ERROR(f'[{idx}/{total}] 오류: {facility.place} - {str(e)}'))
-
-            time.sleep(delay)
-
-        self.stdout.write(self.style.SUCCESS(f'SportsFacility: 성공 {success_count}, 실패 {fail_count}'))
+        self.stdout.write(self.style.SUCCESS('Geocoding 완료!'))
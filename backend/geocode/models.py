@@ -1,3 +1,56 @@
 from django.db import models
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
 
-# Create your models here.
+from .signals import coordinates_updated
+
+
+class GeocodeCache(models.Model):
+    """주소 → 좌표 변환 결과 캐시. 좌표가 비어 있으면 '찾을 수 없는 주소'로 저장된 결과"""
+    address = models.CharField(max_length=300, unique=True)  # 정규화된 주소
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
+
+    expires_at = models.DateTimeField(db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def is_negative(self):
+        return self.latitude is None or self.longitude is None
+
+    def __str__(self):
+        return self.address
+
+
+class DataVersion(models.Model):
+    """
+    테이블별 변경 번호. 관리 명령처럼 다른 프로세스에서 행을 바꿔도 웹 프로세스가
+    메모리 인덱스/캐시를 다시 만들어야 하는지 PK 조회 한 번으로 알 수 있게 DB에 둔다.
+    """
+    name = models.CharField(max_length=100, primary_key=True)  # 모델 label (app.model)
+    version = models.PositiveBigIntegerField(default=0)
+
+    @classmethod
+    def current(cls, name):
+        version = cls.objects.filter(name=name).values_list('version', flat=True).first()
+        return version or 0
+
+    @classmethod
+    def bump(cls, name):
+        if not cls.objects.filter(name=name).update(version=F('version') + 1):
+            cls.objects.get_or_create(name=name)
+            cls.objects.filter(name=name).update(version=F('version') + 1)
+
+    @classmethod
+    def track(cls, model):
+        """model 행이 저장/삭제되거나 좌표가 일괄 갱신될 때마다 버전을 올린다 (여러 번 불러도 한 번만 연결)"""
+        name = model._meta.label_lower
+
+        def bump(*args, **kwargs):
+            cls.bump(name)
+
+        uid = f"data_version_{name}"
+        post_save.connect(bump, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(bump, sender=model, weak=False, dispatch_uid=uid)
+        coordinates_updated.connect(bump, sender=model, weak=False, dispatch_uid=uid)
+        return name
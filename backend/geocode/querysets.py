@@ -0,0 +1,110 @@
+import math
+
+import numpy as np
+from django.db import models
+
+from geocode.geo import EARTH_RADIUS_KM, haversine_many
+
+# 지구 반대편까지의 거리. 이 이상 넓히면 사실상 전체 테이블이다.
+MAX_RADIUS_KM = math.pi * EARTH_RADIUS_KM
+
+# nearest()가 반경을 넓혀 가며 조회하는 최대 횟수. 그래도 모자라면 (데이터가 드문 지역, 마지막 페이지)
+# 두 배씩 계속 넓히지 않고 전체를 한 번에 조회한다. 쿼리는 최대 NEAREST_MAX_STEPS + 1번.
+NEAREST_MAX_STEPS = 3
+
+
+def bounding_box(lat, lon, km):
+    """
+    (lat, lon) 중심 반경 km 원을 감싸는 위경도 사각형.
+    반환: (lat_min, lat_max, lon_min, lon_max)
+    """
+    angular = km / EARTH_RADIUS_KM
+    d_lat = math.degrees(angular)
+
+    # 원의 경도 방향 끝점 기준 폭. 극 근처면 경도 전체를 본다.
+    cos_lat = math.cos(math.radians(lat))
+    if angular >= math.pi / 2 or cos_lat <= math.sin(angular):
+        d_lon = 180.0
+    else:
+        d_lon = math.degrees(math.asin(math.sin(angular) / cos_lat))
+
+    return lat - d_lat, lat + d_lat, lon - d_lon, lon + d_lon
+
+
+class GeoQuerySet(models.QuerySet):
+    """latitude/longitude 필드를 가진 모델들이 공유하는 위치 기반 QuerySet"""
+
+    def with_coordinates(self):
+        return self.filter(latitude__isnull=False, longitude__isnull=False)
+
+    def within_box(self, lat, lon, km):
+        """반경 km를 감싸는 사각형 안의 행만 남긴다 (latitude/longitude 인덱스 사용)"""
+        lat_min, lat_max, lon_min, lon_max = bounding_box(lat, lon, km)
+        return self.filter(
+            latitude__range=(lat_min, lat_max),
+            longitude__range=(lon_min, lon_max),
+        )
+
+    def within_radius(self, lat, lon, km):
+        """
+        반경 km 안의 객체를 가까운 순(거리가 같으면 pk 순)으로 담은 리스트를 반환한다.
+        DB에서는 사각형 후보만 가져오고, 정확한 하버사인 거리는 후보에만 한 번에 계산해
+        각 객체의 distance 속성(km)에 넣는다.
+        """
+        queryset = self.with_coordinates()
+        if km < MAX_RADIUS_KM:
+            queryset = queryset.within_box(lat, lon, km)
+        candidates = list(queryset)
+        if not candidates:
+            return []
+
+        distances = haversine_many(
+            lat, lon,
+            [obj.latitude for obj in candidates],
+            [obj.longitude for obj in candidates],
+        )
+
+        results = []
+        pks = np.array([obj.pk for obj in candidates])
+        for i in np.lexsort((pks, distances)):
+            if distances[i] > km:
+                break
+            obj = candidates[i]
+            obj.distance = float(distances[i])
+            results.append(obj)
+        return results
+
+    def nearest(self, lat, lon, limit, radius_km=2.0, unique_location=False, after=None):
+        """
+        반경을 두 배씩 넓혀 가며 가까운 limit개를 찾는다.
+        NEAREST_MAX_STEPS번 넓혀도 모자라면 마지막에는 반경 제한 없이 한 번 조회한다.
+        unique_location=True면 같은 좌표의 객체는 가장 먼저 나온 하나만 남긴다.
+        after=(distance, pk)면 그 뒤에 오는 객체만 센다. (커서 페이지네이션용)
+        """
+        km = radius_km
+        if after is not None:
+            # 커서보다 가까운 객체는 필요 없으므로 그 거리부터 탐색
+            km = min(after[0] + radius_km, MAX_RADIUS_KM)
+        for step in range(NEAREST_MAX_STEPS + 1):
+            if step == NEAREST_MAX_STEPS:
+                km = MAX_RADIUS_KM
+            found = self.within_radius(lat, lon, km)
+
+            if unique_location:
+                seen_locations = set()
+                unique = []
+                for obj in found:
+                    location_key = (obj.latitude, obj.longitude)
+                    if location_key in seen_locations:
+                        continue
+                    seen_locations.add(location_key)
+                    unique.append(obj)
+                found = unique
+
+            if after is not None:
+                found = [obj for obj in found if (obj.distance, obj.pk) > after]
+
+            if len(found) >= limit or km >= MAX_RADIUS_KM:
+                break
+            km = min(km * 2, MAX_RADIUS_KM)
+        return found[:limit]
@@ -0,0 +1,73 @@
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import DataVersion
+
+_registry = {}
+
+
+def snap(value, grid_deg):
+    """좌표를 grid_deg 간격 격자점으로 맞춘다 (근처 사용자끼리 같은 캐시 키를 쓰도록)"""
+    return round(round(value / grid_deg) * grid_deg, 7)
+
+
+class NearbyCache:
+    """
+    주변 조회 응답을 Django 캐시에 저장한다.
+    키 = 모델 버전 + 격자에 맞춘 좌표 + limit 등 파라미터.
+    모델 행이 저장/삭제되거나 좌표가 일괄 갱신되면 DataVersion이 올라가 기존 키를 모두 무효화한다.
+    버전은 DB에 있으므로 관리 명령 같은 다른 프로세스의 변경도 다음 조회부터 반영된다.
+    """
+
+    def __init__(self, model, name=None):
+        self.model = model
+        self.name = name or model._meta.label_lower
+        self.version_name = DataVersion.track(model)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        _registry[self.name] = self
+
+    @property
+    def grid_deg(self):
+        return settings.NEARBY_CACHE_GRID_DEG
+
+    def version(self):
+        return DataVersion.current(self.version_name)
+
+    def get_or_compute(self, lat, lon, compute, **params):
+        """
+        (결과, 캐시 적중 여부)를 반환. compute(lat, lon)는 격자에 맞춘 좌표로 호출하므로
+        같은 칸의 사용자는 모두 같은 결과를 받는다. (거리 오차는 격자 간격 절반 이내)
+        """
+        lat = snap(lat, self.grid_deg)
+        lon = snap(lon, self.grid_deg)
+        extra = ":".join(f"{key}={params[key]}" for key in sorted(params))
+        key = f"nearby:{self.name}:{self.version()}:{lat}:{lon}:{extra}"
+
+        value = cache.get(key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value, True
+
+        value = compute(lat, lon)
+        cache.set(key, value, settings.NEARBY_CACHE_TTL)
+        with self._lock:
+            self.misses += 1
+        return value, False
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+def cache_stats():
+    """등록된 모든 주변 조회 캐시의 적중/실패 횟수 (이 프로세스 기준)"""
+    return {name: nearby_cache.stats() for name, nearby_cache in _registry.items()}
@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# bulk_create / bulk_update / update()처럼 post_save가 나가지 않는 경로에서
+# 좌표가 바뀌었음을 알리는 시그널. sender는 모델 클래스.
+coordinates_updated = Signal()
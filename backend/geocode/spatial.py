@@ -0,0 +1,171 @@
+import math
+import threading
+from collections import defaultdict
+
+import numpy as np
+
+from geocode.geo import EARTH_RADIUS_KM, haversine_many, top_k
+from geocode.models import DataVersion
+
+DEFAULT_CELL_DEG = 0.01  # 위도 기준 약 1.1km
+
+
+class GridIndex:
+    """
+    위도/경도를 균일한 격자(cell)로 나눈 메모리 공간 인덱스.
+    k-최근접 조회 시 기준 셀부터 바깥 고리(ring) 순서로만 탐색하고,
+    아직 보지 않은 셀까지의 최소 거리가 k번째 거리보다 멀어지면 바로 멈춘다.
+    """
+
+    def __init__(self, points, cell_deg=DEFAULT_CELL_DEG):
+        """points: (lat, lon, item) 튜플의 iterable"""
+        self.cell_deg = cell_deg
+        self.size = 0
+
+        grouped = defaultdict(list)
+        for lat, lon, item in points:
+            grouped[self._cell(lat, lon)].append((lat, lon, item))
+            self.size += 1
+
+        # 셀마다 (위도 배열, 경도 배열, item 리스트)로 묶어 두고 거리는 배열 단위로 계산
+        self.cells = {}
+        for cell, cell_points in grouped.items():
+            lats, lons, items = zip(*cell_points)
+            self.cells[cell] = (np.array(lats), np.array(lons), list(items))
+
+        if self.cells:
+            rows = [i for i, _ in self.cells]
+            cols = [j for _, j in self.cells]
+            self.bounds = (min(rows), max(rows), min(cols), max(cols))
+        else:
+            self.bounds = None
+
+    def _cell(self, lat, lon):
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def _ring(self, ci, cj, r):
+        """(ci, cj)에서 체비셰프 거리가 정확히 r인 셀 중 데이터 범위 안에 있는 셀 좌표들"""
+        min_i, max_i, min_j, max_j = self.bounds
+        if r == 0:
+            yield ci, cj
+            return
+        j_from, j_to = max(cj - r, min_j), min(cj + r, max_j)
+        for i in (ci - r, ci + r):
+            if min_i <= i <= max_i:
+                for j in range(j_from, j_to + 1):
+                    yield i, j
+        i_from, i_to = max(ci - r + 1, min_i), min(ci + r - 1, max_i)
+        for j in (cj - r, cj + r):
+            if min_j <= j <= max_j:
+                for i in range(i_from, i_to + 1):
+                    yield i, j
+
+    def _clearance_km(self, lat, lon, ci, cj, r):
+        """
+        고리 0~r을 모두 본 뒤, 아직 보지 않은 점까지의 거리 하한(km).
+        위도 방향은 호 길이, 경도 방향은 사각형 안 최대 위도의 cos로 보수적으로 잡는다.
+        """
+        lat_low = (ci - r) * self.cell_deg
+        lat_high = (ci + r + 1) * self.cell_deg
+        lon_low = (cj - r) * self.cell_deg
+        lon_high = (cj + r + 1) * self.cell_deg
+
+        d_lat = min(lat - lat_low, lat_high - lat)
+        d_lon = min(lon - lon_low, lon_high - lon)
+
+        max_abs_lat = min(90.0, max(abs(lat_low), abs(lat_high)))
+        lat_km = EARTH_RADIUS_KM * math.radians(d_lat)
+        lon_km = 2 * EARTH_RADIUS_KM * math.cos(math.radians(max_abs_lat)) * math.sin(math.radians(d_lon) / 2)
+        return max(0.0, min(lat_km, lon_km))
+
+    def nearest(self, lat, lon, k):
+        """
+        (lat, lon)에서 가까운 순으로 최대 k개의 (distance_km, item)을 반환.
+        """
+        if k <= 0 or not self.cells:
+            return []
+
+        ci, cj = self._cell(lat, lon)
+        min_i, max_i, min_j, max_j = self.bounds
+        # 데이터 범위 밖의 빈 고리는 건너뛴다
+        first_ring = max(0, min_i - ci, ci - max_i, min_j - cj, cj - max_j)
+        max_ring = max(ci - min_i, max_i - ci, cj - min_j, max_j - cj)
+        ring_limit = 2 * ((max_i - min_i + 1) + (max_j - min_j + 1))
+
+        # 지금까지 본 셀들의 거리 배열과 item 목록
+        dist_chunks = []
+        items = []
+        kth = math.inf
+
+        def visit(cells):
+            nonlocal kth
+            lats = [c[0] for c in cells]
+            lons = [c[1] for c in cells]
+            dist_chunks.append(haversine_many(lat, lon, np.concatenate(lats), np.concatenate(lons)))
+            for c in cells:
+                items.extend(c[2])
+            if len(items) >= k:
+                kth = np.partition(np.concatenate(dist_chunks), k - 1)[k - 1]
+
+        for r in range(first_ring, max_ring + 1):
+            # 고리 셀 수가 실제 채워진 셀 수보다 많아지면 남은 셀을 직접 훑는 편이 싸다
+            if min(8 * r, ring_limit) > len(self.cells):
+                rest = [
+                    cell for (i, j), cell in self.cells.items()
+                    if max(abs(i - ci), abs(j - cj)) >= r
+                ]
+                if rest:
+                    visit(rest)
+                break
+
+            ring = [self.cells[c] for c in self._ring(ci, cj, r) if c in self.cells]
+            if ring:
+                visit(ring)
+
+            if kth <= self._clearance_km(lat, lon, ci, cj, r):
+                break
+
+        if not items:
+            return []
+
+        distances = np.concatenate(dist_chunks)
+        return [(float(distances[i]), items[i]) for i in top_k(distances, k)]
+
+
+class ModelGridIndex:
+    """
+    모델 테이블을 GridIndex로 올려두고, 조회할 때마다 DataVersion을 확인해
+    행이 저장/삭제되거나 좌표가 일괄 갱신됐으면 (다른 프로세스의 관리 명령 포함) 다시 만든다.
+    item으로는 fields의 values() dict가 들어간다.
+    """
+
+    def __init__(self, model, fields, cell_deg=DEFAULT_CELL_DEG):
+        self.model = model
+        self.fields = fields
+        self.cell_deg = cell_deg
+        self._index = None
+        self._version = None
+        self._lock = threading.Lock()
+        self.version_name = DataVersion.track(model)
+
+    def build(self):
+        rows = self.model._default_manager.filter(
+            latitude__isnull=False, longitude__isnull=False
+        ).values(*self.fields)
+        return GridIndex(
+            ((row["latitude"], row["longitude"], row) for row in rows.iterator()),
+            cell_deg=self.cell_deg,
+        )
+
+    def get(self):
+        version = DataVersion.current(self.version_name)
+        if self._index is None or self._version != version:
+            with self._lock:
+                if self._index is None or self._version != version:
+                    # 버전을 빌드 전에 읽으므로, 빌드 도중 행이 바뀌면 다음 조회에서 다시 만든다
+                    self._index = self.build()
+                    self._version = version
+        return self._index
+
+    def nearest(self, lat, lon, k):
+        return self.get().nearest(lat, lon, k)
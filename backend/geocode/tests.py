@@ -1,3 +1,61 @@
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from main.models import OutdoorEquipment
+
+from .models import DataVersion
+from .response_cache import NearbyCache, _registry
+from .signals import coordinates_updated
+from .spatial import ModelGridIndex
+
+
+class ModelGridIndexTests(TestCase):
+    def setUp(self):
+        self.index = ModelGridIndex(OutdoorEquipment, fields=("id", "name", "latitude", "longitude"))
+        OutdoorEquipment.objects.create(name="a", address="a", latitude=37.5, longitude=127.0)
+
+    def names_near(self):
+        return [item["name"] for _, item in self.index.nearest(37.5, 127.0, 10)]
+
+    def test_rebuilt_after_save(self):
+        self.assertEqual(self.names_near(), ["a"])
+        OutdoorEquipment.objects.create(name="b", address="b", latitude=37.5001, longitude=127.0)
+        self.assertEqual(self.names_near(), ["a", "b"])
+
+    def test_rebuilt_after_change_in_other_process(self):
+        self.assertEqual(self.names_near(), ["a"])
+
+        # 관리 명령 프로세스: 시그널 없이 일괄 저장하고 그 프로세스의 시그널이 DB 버전만 올린다
+        OutdoorEquipment.objects.bulk_create([
+            OutdoorEquipment(name="b", address="b", latitude=37.5001, longitude=127.0),
+        ])
+        self.assertEqual(self.names_near(), ["a"])
+        DataVersion.bump(OutdoorEquipment._meta.label_lower)
+
+        self.assertEqual(self.names_near(), ["a", "b"])
+
+    def test_coordinates_updated_bumps_version(self):
+        name = OutdoorEquipment._meta.label_lower
+        before = DataVersion.current(name)
+        coordinates_updated.send(sender=OutdoorEquipment)
+        self.assertEqual(DataVersion.current(name), before + 1)
+
+
+class NearbyCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.nearby_cache = NearbyCache(OutdoorEquipment, name="test-equipment")
+        self.addCleanup(_registry.pop, "test-equipment", None)
+
+    def test_version_bump_from_other_process_invalidates(self):
+        compute = lambda lat, lon: OutdoorEquipment.objects.count()
+
+        self.assertEqual(self.nearby_cache.get_or_compute(37.5, 127.0, compute), (0, False))
+        self.assertEqual(self.nearby_cache.get_or_compute(37.5, 127.0, compute), (0, True))
+
+        # 다른 프로세스의 변경은 이 프로세스의 locmem 캐시를 건드리지 못하고 DB 버전만 올린다
+        OutdoorEquipment.objects.bulk_create([OutdoorEquipment(name="a", address="a")])
+        DataVersion.bump(OutdoorEquipment._meta.label_lower)
+
+        self.assertEqual(self.nearby_cache.get_or_compute(37.5, 127.0, compute), (1, False))
@@ -1,6 +1,7 @@
 from django.urls import path
-from .views import GeocodeView
+from .views import NearbyCacheStatsView, geocode_view
 
 urlpatterns = [
-    path("", GeocodeView.as_view(), name="geocode"),
+    path("", geocode_view, name="geocode"),
+    path("cache-stats/", NearbyCacheStatsView.as_view(), name="nearby_cache_stats"),
 ]
\ No newline at end of file
@@ -1,21 +1,94 @@
-import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
 
-def geocode_address(address):
-    url = "https://dapi.kakao.com/v2/local/search/address.json"
-    headers = {"Authorization": f"KakaoAK {settings.KAKAO_API_KEY}"}
+from config import clients
 
-    res = requests.get(url, headers=headers, params={"query": address})
+from .cache import geocode_cache, normalize_address
+
+KAKAO_ADDRESS_URL = "https://dapi.kakao.com/v2/local/search/address.json"
 
-    # HTTP 상태 코드 체크
-    if res.status_code != 200:
-        print(f"API 에러 (status {res.status_code}): {res.text}")
-        return None, None
 
-    data = res.json()
+def kakao_headers():
+    return {"Authorization": f"KakaoAK {settings.KAKAO_API_KEY}"}
+
+
+def parse_geocode(status_code, text, data):
+    """카카오 응답 → (lat, lon) / 결과 없음이면 (None, None) / HTTP 에러면 None"""
+    # HTTP 상태 코드 체크
+    if status_code != 200:
+        print(f"API 에러 (status {status_code}): {text}")
+        return None
 
     if data.get("meta", {}).get("total_count", 0) == 0:
         return None, None
 
     doc = data["documents"][0]
-    return float(doc["y"]), float(doc["x"])
\ No newline at end of file
+    return float(doc["y"]), float(doc["x"])
+
+
+def request_geocode(address):
+    """
+    카카오 주소 검색 API 호출.
+    반환: (lat, lon) / 결과 없음이면 (None, None) / HTTP 에러면 None
+    """
+    res = clients.get(KAKAO_ADDRESS_URL, headers=kakao_headers(), params={"query": address})
+    return parse_geocode(res.status_code, res.text, res.json() if res.status_code == 200 else {})
+
+
+async def arequest_geocode(address):
+    """request_geocode의 비동기 버전 (공유 httpx.AsyncClient 사용)"""
+    res = await clients.aget(KAKAO_ADDRESS_URL, headers=kakao_headers(), params={"query": address})
+    return parse_geocode(res.status_code, res.text, res.json() if res.status_code == 200 else {})
+
+
+def geocode_address(address):
+    """
+    주소를 (lat, lon)으로 변환. 실패하면 (None, None).
+    결과는 정규화된 주소 기준으로 캐시하며, 찾을 수 없는 주소도 일정 기간 캐시해
+    같은 주소로 API를 반복 호출하지 않는다. (HTTP 에러는 캐시하지 않음)
+    """
+    key = normalize_address(address)
+    if not key:
+        return None, None
+
+    cached = geocode_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = request_geocode(key)
+    if result is None:
+        return None, None
+
+    lat, lon = result
+    geocode_cache.set(key, lat, lon)
+    return lat, lon
+
+
+async def ageocode_lookup(address):
+    """
+    geocode_address의 비동기 버전이지만 HTTP 에러를 구분한다.
+    반환: (lat, lon) / 찾을 수 없음 (None, None) / HTTP 에러 None
+    캐시 조회/저장(DB)은 스레드에서 실행한다.
+    """
+    key = normalize_address(address)
+    if not key:
+        return None, None
+
+    # 메모리 캐시는 바로 보고, 없을 때만 스레드에서 DB 캐시를 조회
+    cached = geocode_cache.memory.get(key)
+    if cached is None:
+        cached = await sync_to_async(geocode_cache.get)(key)
+    if cached is not None:
+        return cached
+
+    result = await arequest_geocode(key)
+    if result is None:
+        return None
+
+    await sync_to_async(geocode_cache.set)(key, *result)
+    return result
+
+
+async def ageocode_address(address):
+    """geocode_address의 비동기 버전. 실패하면 (None, None)"""
+    return await ageocode_lookup(address) or (None, None)
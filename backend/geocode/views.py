@@ -1,38 +1,61 @@
-import requests
-from django.conf import settings
+import json
+
+import httpx
+from django.http import JsonResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+
+from .response_cache import cache_stats
+from .utils import ageocode_lookup
+
+
+async def geocode_view(request):
+    """
+    POST {"address": ...} → {"address", "latitude", "longitude"}
+    ASGI에서 공유 비동기 클라이언트로 카카오 API를 호출하며, 결과는 geocode 캐시를 거친다.
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "POST만 지원합니다."}, status=405)
+
+    if request.content_type == "application/json":
+        try:
+            address = json.loads(request.body or b"{}").get("address")
+        except (ValueError, AttributeError):
+            return JsonResponse({"error": "잘못된 JSON 형식입니다."}, status=400)
+    else:
+        address = request.POST.get("address")
+
+    if not address:
+        return JsonResponse({"error": "address 필드가 필요합니다."}, status=400)
 
+    try:
+        result = await ageocode_lookup(address)
+    except (httpx.HTTPError, ValueError):
+        result = None
 
-class GeocodeView(APIView):
-    def post(self, request):
-        address = request.data.get("address")
+    if result is None:
+        return JsonResponse({"error": "카카오 API 요청 실패"}, status=500)
 
-        if not address:
-            return Response({"error": "address 필드가 필요합니다."}, status=400)
+    latitude, longitude = result
+    if latitude is None:
+        return JsonResponse({"error": "해당 주소를 찾을 수 없습니다."}, status=404)
 
-        url = "https://dapi.kakao.com/v2/local/search/address.json"
-        headers = {"Authorization": f"KakaoAK {settings.KAKAO_API_KEY}"}
-        params = {"query": address}
+    return JsonResponse({
+        "address": address,
+        "latitude": latitude,
+        "longitude": longitude
+    })
 
-        res = requests.get(url, headers=headers, params=params)
 
-        if res.status_code != 200:
-            return Response({"error": "카카오 API 요청 실패"}, status=500)
+# 토큰 없이 호출하는 API이므로 CSRF 검사 제외 (Django 4.2 csrf_exempt 데코레이터는 async 뷰를 감싸지 못함)
+geocode_view.csrf_exempt = True
 
-        data = res.json()
 
-        if data["meta"]["total_count"] == 0:
-            return Response({"error": "해당 주소를 찾을 수 없습니다."}, status=404)
+class NearbyCacheStatsView(APIView):
+    """주변 조회 응답 캐시의 적중/실패 횟수 (관리자용, 이 프로세스 기준)"""
 
-        # 첫 번째 결과 사용
-        info = data["documents"][0]
-        latitude = info["y"]
-        longitude = info["x"]
+    permission_classes = [IsAdminUser]
 
-        return Response({
-            "address": address,
-            "latitude": latitude,
-            "longitude": longitude
-        })
\ No newline at end of file
+    def get(self, request):
+        return Response(cache_stats())
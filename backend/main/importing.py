@@ -0,0 +1,349 @@
+import codecs
+import csv
+import glob
+import hashlib
+import io
+import json
+import sys
+import time
+from itertools import islice
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from geocode.engine import GeocodeEngine, get_targets
+from geocode.signals import coordinates_updated
+
+SAMPLE_SIZE = 64 * 1024
+
+
+def detect_encoding(sample):
+    """
+    파일 앞부분 바이트만 보고 utf-8-sig / cp949 중 하나를 고른다.
+    샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않는다.
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def expand_sources(sources):
+    """경로/glob 패턴 목록을 실제 파일 목록으로 바꾼다 ('-'는 표준입력)"""
+    paths = []
+    for source in sources:
+        if source == "-":
+            paths.append(source)
+            continue
+        matched = sorted(glob.glob(source))
+        if not matched:
+            raise CommandError(f"파일을 찾을 수 없습니다: {source}")
+        paths.extend(matched)
+    return paths
+
+
+def open_source(source, encoding="auto", errors="strict"):
+    """
+    경로(또는 '-' = 표준입력)를 텍스트 스트림으로 연다.
+    encoding='auto'면 버퍼에서 앞부분을 peek 해서 고르므로 파일을 두 번 디코딩하지 않는다.
+    반환: (텍스트 스트림, 사용한 인코딩)
+    """
+    raw = sys.stdin.buffer if source == "-" else open(source, "rb")
+    buffered = io.BufferedReader(raw, buffer_size=SAMPLE_SIZE)
+
+    if encoding == "auto":
+        encoding = detect_encoding(buffered.peek(SAMPLE_SIZE)[:SAMPLE_SIZE])
+
+    return io.TextIOWrapper(buffered, encoding=encoding, errors=errors, newline=""), encoding
+
+
+def row_digest(values):
+    """필드 값 목록의 내용 해시 (변경 감지용, 좌표는 포함하지 않는다)"""
+    payload = json.dumps(values, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+class CsvImporter:
+    """
+    CSV 한 줄을 모델 필드 dict로 바꿔 DB에 반영하는 공용 importer.
+    행은 제너레이터로 흘려보내고 batch_size개씩 끊어 저장하므로 파일 크기와 상관없이
+    메모리 사용량이 일정하다. bulk 연산은 save()를 거치지 않으므로 geocoding은 하지 않는다.
+
+    반영 방식(mode)
+      sync   : natural_key로 기존 행과 맞춰 보고 추가/변경/삭제분만 반영 (기본)
+      upsert : sync와 같지만 파일에 없는 기존 행은 지우지 않는다
+      append : 비교 없이 모두 새로 추가
+    변경된 행도 주소가 그대로면 이미 구한 좌표를 유지하고, 주소가 바뀐 행만 좌표를 비운다.
+    """
+
+    model = None
+    fields = ()             # map_row가 채우는 필드 (내용 해시 대상)
+    natural_key = ()        # 행을 식별하는 필드 (sync/upsert용)
+    encoding_errors = "strict"
+    geocode_target = None   # geocode.engine 대상 키 (주소 필드, import 후 geocoding 단계용)
+    default_mode = "sync"
+
+    MODES = ("sync", "upsert", "append")
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.read_count = 0
+        self.skipped_count = 0
+        self.duplicate_count = 0
+        self.created_count = 0
+        self.updated_count = 0
+        self.relocated_count = 0
+        self.unchanged_count = 0
+        self.deleted_count = 0
+
+    @property
+    def address_fields(self):
+        targets = get_targets(self.geocode_target) if self.geocode_target else []
+        return targets[0].address_fields if targets else ()
+
+    @property
+    def changed_count(self):
+        return self.created_count + self.updated_count + self.deleted_count
+
+    def map_row(self, row):
+        """CSV 행(dict) → 모델 필드 dict. 저장하지 않을 행은 None"""
+        raise NotImplementedError
+
+    def read_rows(self, stream):
+        yield from csv.DictReader(stream)
+
+    def build_data(self, rows):
+        for row in rows:
+            self.read_count += 1
+            data = self.map_row(row)
+            if data is None:
+                self.skipped_count += 1
+                continue
+            yield data
+
+    def key_of(self, data):
+        return tuple(data.get(field) for field in self.natural_key)
+
+    def address_of(self, data):
+        return tuple(data.get(field) for field in self.address_fields)
+
+    def load_existing(self):
+        """
+        기존 행을 natural key → (pk, 내용 해시, 주소)로 읽는다.
+        같은 key가 여러 행이면 pk가 가장 작은 행만 남기고 나머지 pk는 삭제 대상으로 돌려준다.
+        """
+        existing = {}
+        stale_pks = []
+        rows = (
+            self.model._default_manager
+            .order_by("pk")
+            .values_list("pk", *self.fields)
+            .iterator(chunk_size=self.batch_size)
+        )
+        for pk, *values in rows:
+            data = dict(zip(self.fields, values))
+            key = self.key_of(data)
+            if key in existing:
+                stale_pks.append(pk)
+                continue
+            existing[key] = (pk, row_digest(values), self.address_of(data))
+        return existing, stale_pks
+
+    def run(self, rows, mode=None, dry_run=False):
+        """
+        rows: CSV 행(dict) iterable. 여러 파일을 이어 붙여도 하나의 트랜잭션으로 반영한다.
+        dry_run=True면 비교까지만 하고 DB에는 쓰지 않는다. (반영될 개수만 센다)
+        """
+        mode = mode or self.default_mode
+        if mode not in self.MODES:
+            raise ValueError(f"알 수 없는 mode: {mode}")
+
+        self.dry_run = dry_run
+        with transaction.atomic():
+            if mode == "append":
+                self.append(self.build_data(rows))
+            else:
+                self.sync(self.build_data(rows), delete=(mode == "sync"))
+
+        if self.changed_count and not dry_run:
+            coordinates_updated.send(sender=self.model)
+        return self.changed_count
+
+    def append(self, data_rows):
+        objects = (self.model(**data) for data in data_rows)
+        while True:
+            batch = list(islice(objects, self.batch_size))
+            if not batch:
+                break
+            if not self.dry_run:
+                self.model._default_manager.bulk_create(batch)
+            self.created_count += len(batch)
+
+    def sync(self, data_rows, delete=True):
+        existing, stale_pks = self.load_existing()
+        seen = set()
+        to_create, to_update, to_relocate = [], [], []
+
+        for data in data_rows:
+            key = self.key_of(data)
+            if key in seen:
+                # 같은 파일 안의 중복 key는 처음 나온 행만 사용
+                self.duplicate_count += 1
+                continue
+            seen.add(key)
+
+            found = existing.get(key)
+            if found is None:
+                to_create.append(self.model(**data))
+            else:
+                pk, digest, address = found
+                if digest == row_digest([data.get(field) for field in self.fields]):
+                    self.unchanged_count += 1
+                    continue
+                obj = self.model(pk=pk, **data)
+                if self.address_of(data) != address:
+                    to_relocate.append(obj)
+                else:
+                    to_update.append(obj)
+
+            if len(to_create) + len(to_update) + len(to_relocate) >= self.batch_size:
+                self.flush(to_create, to_update, to_relocate)
+                to_create, to_update, to_relocate = [], [], []
+
+        self.flush(to_create, to_update, to_relocate)
+
+        if delete:
+            removed = [pk for key, (pk, _, _) in existing.items() if key not in seen]
+            self.delete(removed + stale_pks)
+
+    def flush(self, to_create, to_update, to_relocate):
+        manager = self.model._default_manager
+        update_fields = [field for field in self.fields if field not in self.natural_key]
+
+        if not self.dry_run:
+            if to_create:
+                manager.bulk_create(to_create)
+            if to_update and update_fields:
+                manager.bulk_update(to_update, update_fields)
+            if to_relocate:
+                # 주소가 바뀐 행은 예전 좌표를 비워 geocoding 대상으로 되돌린다
+                for obj in to_relocate:
+                    obj.latitude = None
+                    obj.longitude = None
+                manager.bulk_update(to_relocate, update_fields + ["latitude", "longitude"])
+
+        self.created_count += len(to_create)
+        self.updated_count += len(to_update) + len(to_relocate)
+        self.relocated_count += len(to_relocate)
+
+    def delete(self, pks):
+        for start in range(0, len(pks), self.batch_size):
+            chunk = pks[start:start + self.batch_size]
+            if not self.dry_run:
+                self.model._default_manager.filter(pk__in=chunk).delete()
+            self.deleted_count += len(chunk)
+
+
+def clean(value):
+    """CSV 셀 값 앞뒤 공백 제거 (None은 빈 문자열)"""
+    return (value or "").strip()
+
+
+class CsvImportCommand(BaseCommand):
+    """CsvImporter를 실행하는 management command 공통 부분 (GUI 없이 cron 등에서 실행 가능)"""
+
+    importer_class = None
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "sources",
+            nargs="+",
+            help="CSV 파일 경로 또는 glob 패턴 (여러 개 가능, '-'는 표준입력)",
+        )
+        parser.add_argument(
+            "--encoding",
+            default="auto",
+            help="파일 인코딩 (auto, utf-8-sig, cp949 등). auto는 앞부분 바이트로 판별",
+        )
+        self.add_import_arguments(parser)
+
+    def add_import_arguments(self, parser):
+        """CSV가 아닌 원본(API 등)을 쓰는 command도 공유하는 옵션"""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="bulk 연산 한 번에 반영할 행 수",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=CsvImporter.MODES,
+            help=(
+                "sync: 추가/변경/삭제분만 반영, upsert: 삭제 없이 반영, append: 모두 새로 추가 "
+                "(기본값은 importer마다 다름)"
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="DB에 쓰지 않고 반영될 개수와 처리량만 확인",
+        )
+        parser.add_argument(
+            "--geocode",
+            action="store_true",
+            help="저장 후 좌표가 없는 행을 바로 geocoding (geocode_all 과 같은 엔진)",
+        )
+
+    def read_sources(self, paths, encoding, importer):
+        """여러 파일의 CSV 행을 하나로 이어서 흘려보낸다"""
+        for path in paths:
+            stream, used = open_source(path, encoding, importer.encoding_errors)
+            self.stdout.write(f"📄 {'표준입력' if path == '-' else path} (인코딩: {used})")
+            with stream:
+                yield from importer.read_rows(stream)
+
+    def get_rows(self, importer, options):
+        """importer.run()에 넘길 행 iterable (CSV 대신 다른 원본을 쓰려면 재정의)"""
+        paths = expand_sources(options["sources"])
+        return self.read_sources(paths, options["encoding"], importer)
+
+    def handle(self, *args, **options):
+        importer = self.importer_class(batch_size=options["batch_size"])
+        mode = options["mode"] or importer.default_mode
+        start = time.perf_counter()
+        try:
+            rows = self.get_rows(importer, options)
+            importer.run(rows, mode=mode, dry_run=options["dry_run"])
+        except (OSError, ValueError, csv.Error) as e:
+            # requests 예외는 OSError, JSON/디코딩 오류는 ValueError의 하위 클래스
+            raise CommandError(f"❌ 데이터 읽기 실패: {e}")
+        elapsed = time.perf_counter() - start
+        rate = importer.read_count / elapsed if elapsed else 0
+        changes = (
+            f"추가 {importer.created_count}, 변경 {importer.updated_count} "
+            f"(좌표 초기화 {importer.relocated_count}), 삭제 {importer.deleted_count}, "
+            f"그대로 {importer.unchanged_count}"
+        )
+        summary = (
+            f"(읽은 행 {importer.read_count}, 건너뜀 {importer.skipped_count}, "
+            f"중복 {importer.duplicate_count}, {elapsed:.2f}초, {rate:,.0f}행/초)"
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"🧪 dry-run [{mode}]: {changes} {summary}"))
+            return
+
+        self.stdout.write(self.style.SUCCESS(f"🌟 [{mode}] {changes} {summary}"))
+
+        if options["geocode"] and importer.geocode_target:
+            engine = GeocodeEngine(rate=settings.KAKAO_RATE_LIMIT, log=self.stdout.write)
+            for target in get_targets(importer.geocode_target):
+                engine.run(target)
+        elif importer.geocode_target:
+            self.stdout.write(
+                f"좌표는 'python manage.py geocode_all --model {importer.geocode_target}' 로 채우세요."
+            )
@@ -1,46 +1,83 @@
-from django.core.management.base import BaseCommand
+import json
+import tempfile
+
+from main.importing import CsvImportCommand, CsvImporter
 from main.models import OutdoorEquipment
-from main.utils import fetch_equipment_data
+from main.utils import iter_equipment_items
 
 
-class Command(BaseCommand):
-    help = "충청남도 천안시 실외운동기구 정보를 API에서 불러와 DB에 저장"
+class EquipmentImporter(CsvImporter):
+    model = OutdoorEquipment
+    fields = ("name", "address", "equipment_info")
+    natural_key = ("name",)
+    geocode_target = "outdoor"
+    # 예전 update_or_create와 같이 API에서 빠진 시설은 지우지 않는다
+    default_mode = "upsert"
 
-    def handle(self, *args, **kwargs):
-        data = fetch_equipment_data()
-        items = data.get("data", [])
+    def map_row(self, item):
+        name = item.get("시설명")
 
-        if not items:
-            self.stdout.write(self.style.WARNING("API 결과에 data가 비어있음."))
-            return
+        # 시설명 없거나 더미값이면 skip
+        if not name or name == "string":
+            return None
 
-        saved_count = 0
+        # 운동기구 1~10 유동적 수집
+        equip_data = {}
+        for i in range(1, 11):
+            eq_name_key = f"운동기구{i}"
+            eq_count_key = f"운동기구{i} 개수"
 
-        for item in items:
-            name = item.get("시설명")
+            if item.get(eq_name_key):  # 값이 있을 경우만 저장
+                equip_data[eq_name_key] = item.get(eq_name_key)
+                equip_data[eq_count_key] = item.get(eq_count_key, 0)
 
-            # 시설명 없거나 더미값이면 skip
-            if not name or name == "string":
-                continue
+        return {
+            "name": name,
+            "address": item.get("소재지") or "",
+            "equipment_info": equip_data,
+        }
 
-            # 운동기구 1~10 유동적 수집
-            equip_data = {}
-            for i in range(1, 11):
-                eq_name_key = f"운동기구{i}"
-                eq_count_key = f"운동기구{i} 개수"
 
-                if item.get(eq_name_key):  # 값이 있을 경우만 저장
-                    equip_data[eq_name_key] = item.get(eq_name_key)
-                    equip_data[eq_count_key] = item.get(eq_count_key, 0)
+class Command(CsvImportCommand):
+    help = "충청남도 천안시 실외운동기구 정보를 API에서 모든 페이지 불러와 DB에 저장"
+    importer_class = EquipmentImporter
 
-            OutdoorEquipment.objects.update_or_create(
-                name=name,
-                defaults={
-                    "address": item.get("소재지") or "",
-                    "equipment_info": equip_data,
-                },
-            )
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--per-page",
+            type=int,
+            default=1000,
+            help="API 한 페이지당 항목 수",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="동시에 받는 페이지 수",
+        )
+        self.add_import_arguments(parser)
 
-            saved_count += 1
+    def get_rows(self, importer, options):
+        """
+        트랜잭션(SQLite 쓰기 잠금)을 열기 전에 모든 페이지를 받아 임시 파일에 한 줄씩 적어 두고,
+        import는 그 파일을 다시 읽어 흘려보낸다. 메모리에는 받는 중인 페이지만 올라간다.
+        """
+        self.stdout.write("🌐 실외운동기구 API에서 페이지를 받아오는 중...")
+        spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+        try:
+            received = 0
+            for item in iter_equipment_items(per_page=options["per_page"], workers=options["workers"]):
+                spool.write(json.dumps(item, ensure_ascii=False) + "\n")
+                received += 1
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        self.stdout.write(f"   {received}건 수신")
+        return self.read_spool(spool)
 
-        self.stdout.write(self.style.SUCCESS(f"총 {saved_count}개의 운동기구 정보 저장 완료"))
\ No newline at end of file
+    @staticmethod
+    def read_spool(spool):
+        with spool:
+            for line in spool:
+                yield json.loads(line)
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_outdoorequipment_latitude_outdoorequipment_longitude_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='outdoorequipment',
+            index=models.Index(fields=['latitude', 'longitude'], name='main_outdoo_latitud_500d80_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sportsfacility',
+            index=models.Index(fields=['latitude', 'longitude'], name='main_sports_latitud_70ba6d_idx'),
+        ),
+    ]
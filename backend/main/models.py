@@ -1,5 +1,9 @@
 from django.db import models
 
+from geocode.querysets import GeoQuerySet
+from geocode.response_cache import NearbyCache
+from geocode.spatial import ModelGridIndex
+
 class OutdoorEquipment(models.Model):
     name = models.CharField(max_length=255)
     address = models.CharField(max_length=255)
@@ -8,6 +12,13 @@ class OutdoorEquipment(models.Model):
 
     equipment_info = models.JSONField(default=dict)   # 운동기구 1~10 저장하는 필드
 
+    objects = GeoQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["latitude", "longitude"]),
+        ]
+
     def save(self, *args, **kwargs):
         if self.address and not self.latitude and not self.longitude:
             try:
@@ -23,6 +34,15 @@ class OutdoorEquipment(models.Model):
     def __str__(self):
         return self.name
 
+
+# 주변 운동기구 조회용 격자 인덱스 (행 저장/삭제 시 자동 재생성)
+equipment_index = ModelGridIndex(
+    OutdoorEquipment,
+    fields=("id", "name", "address", "latitude", "longitude"),
+)
+equipment_nearby_cache = NearbyCache(OutdoorEquipment)
+
+
 class SportsFacility(models.Model):
     location = models.CharField(max_length=200)      # 위치
     place = models.CharField(max_length=200)         # 장소
@@ -31,6 +51,13 @@ class SportsFacility(models.Model):
     latitude = models.FloatField(blank=True, null=True)
     longitude = models.FloatField(blank=True, null=True)
 
+    objects = GeoQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["latitude", "longitude"]),
+        ]
+
     def save(self, *args, **kwargs):
         if self.address and not self.latitude and not self.longitude:
             try:
@@ -1,3 +1,30 @@
-from django.test import TestCase
+import io
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+
+from .models import OutdoorEquipment
+
+
+class LoadEquipmentTests(TransactionTestCase):
+    """API 페이지를 받는 동안에는 쓰기 트랜잭션을 열지 않는다"""
+
+    def test_pages_fetched_outside_transaction(self):
+        in_transaction = []
+
+        def fake_items(per_page, workers):
+            for i in range(5):
+                in_transaction.append(connection.in_atomic_block)
+                yield {"시설명": f"기구-{i}", "소재지": f"주소 {i}", "운동기구1": "철봉", "운동기구1 개수": 1}
+
+        with mock.patch("main.management.commands.load_equipment.iter_equipment_items", fake_items):
+            call_command("load_equipment", "--batch-size", "2", stdout=io.StringIO())
+
+        self.assertEqual(in_transaction, [False] * 5)
+        self.assertEqual(OutdoorEquipment.objects.count(), 5)
+        self.assertEqual(
+            OutdoorEquipment.objects.get(name="기구-3").equipment_info,
+            {"운동기구1": "철봉", "운동기구1 개수": 1},
+        )
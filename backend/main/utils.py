@@ -1,50 +1,54 @@
 import math
-import requests
-from math import radians, sin, cos, asin, sqrt
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import count, islice
 
+from config import clients
 
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """
-    기존 거리 계산 (km). 하버사인과 동일한 계산이지만 남겨둔다.
-    """
-    R = 6371  # km
-
-    d_lat = math.radians(lat2 - lat1)
-    d_lon = math.radians(lon2 - lon1)
-
-    a = (
-        math.sin(d_lat / 2) ** 2 +
-        math.cos(math.radians(lat1)) *
-        math.cos(math.radians(lat2)) *
-        math.sin(d_lon / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
-
-
-def haversine(lat1, lon1, lat2, lon2):
-    """
-    두 좌표(위도/경도) 사이의 거리(km)를 반환.
-    """
-    R = 6371  # km
-
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
+EQUIPMENT_URL = "https://api.odcloud.kr/api/15037957/v1/uddi:7994f41a-bd52-4fc1-a684-a2f37b45cd60"
+SERVICE_KEY = "7bfd298f805bb64a62209ad0201852f850e8b53a92a1d75f58274dc68fd0c015"
 
-    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-    c = 2 * asin(sqrt(a))
-    return R * c
-
-def fetch_equipment_data():
-    url = "https://api.odcloud.kr/api/15037957/v1/uddi:7994f41a-bd52-4fc1-a684-a2f37b45cd60"
 
+def fetch_equipment_data(page=1, per_page=1000):
+    """실외운동기구 API 한 페이지 (JSON dict)"""
     params = {
-        "serviceKey": "7bfd298f805bb64a62209ad0201852f850e8b53a92a1d75f58274dc68fd0c015",
-        "page": 1,
-        "perPage": 1000,
+        "serviceKey": SERVICE_KEY,
+        "page": page,
+        "perPage": per_page,
         "returnType": "JSON"
     }
 
-    response = requests.get(url, params=params)
+    response = clients.get(EQUIPMENT_URL, params=params)
+    response.raise_for_status()
     return response.json()
+
+
+def iter_equipment_items(per_page=1000, workers=4):
+    """
+    모든 페이지의 항목을 하나씩 흘려보낸다.
+    첫 페이지의 totalCount로 페이지 수를 정하고, 나머지 페이지는 최대 workers개까지 동시에 받아
+    도착한 순서대로 내보낸다. 메모리에는 받는 중인 페이지만 올라간다.
+    """
+    first = fetch_equipment_data(1, per_page)
+    yield from first.get("data", [])
+
+    total = first.get("totalCount")
+    if total is None:
+        # 전체 개수를 알 수 없으면 빈 페이지가 나올 때까지 차례로 요청
+        for page in count(2):
+            items = fetch_equipment_data(page, per_page).get("data", [])
+            yield from items
+            if len(items) < per_page:
+                return
+
+    pages = iter(range(2, math.ceil(total / per_page) + 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(fetch_equipment_data, page, per_page) for page in islice(pages, workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                data = future.result()
+                # 다음 페이지를 먼저 요청해 두고 결과를 내보낸다
+                page = next(pages, None)
+                if page is not None:
+                    pending.add(executor.submit(fetch_equipment_data, page, per_page))
+                yield from data.get("data", [])
@@ -1,7 +1,6 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from .models import OutdoorEquipment
-from .utils import haversine
+from .models import equipment_index, equipment_nearby_cache
 
 class NearbyEquipmentAPI(APIView):
     def get(self, request):
@@ -10,27 +9,27 @@ class NearbyEquipmentAPI(APIView):
         쿼리 파라미터:
           - lat, lon: 필수. 사용자 위도/경도.
           - limit: 선택. 반환 개수. 기본 5.
+        근처(격자 한 칸) 사용자의 같은 요청은 캐시된 응답을 돌려준다. (X-Cache 헤더)
         """
         user_lat = float(request.GET.get("lat"))
         user_lon = float(request.GET.get("lon"))
         limit = int(request.GET.get("limit", 5))
 
-        equips = OutdoorEquipment.objects.exclude(
-            latitude__isnull=True, longitude__isnull=True
+        results, hit = equipment_nearby_cache.get_or_compute(
+            user_lat, user_lon, lambda lat, lon: self.find_nearest(lat, lon, limit), limit=limit
         )
+        return Response(results, headers={"X-Cache": "HIT" if hit else "MISS"})
 
+    def find_nearest(self, lat, lon, limit):
+        # 격자 인덱스에서 주변 셀만 탐색해 limit개를 바로 얻는다
         results = []
-        for eq in equips:
-            dist = haversine(user_lat, user_lon, eq.latitude, eq.longitude)
+        for dist, eq in equipment_index.nearest(lat, lon, limit):
             results.append({
-                "id": eq.id,
-                "name": eq.name,
-                "lat": eq.latitude,
-                "lon": eq.longitude,
-                "address": eq.address,
+                "id": eq["id"],
+                "name": eq["name"],
+                "lat": eq["latitude"],
+                "lon": eq["longitude"],
+                "address": eq["address"],
                 "distance": round(dist, 3),
             })
-
-        results = sorted(results, key=lambda x: x["distance"])[:limit]
-
-        return Response(results)
+        return results
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Mission, UserMission
+from .models import Mission, UserMission, UserMissionStats
 
 
 @admin.register(Mission)
@@ -14,3 +14,9 @@ class UserMissionAdmin(admin.ModelAdmin):
     list_display = ['user', 'mission', 'status', 'points_earned', 'started_at', 'completed_at']
     list_filter = ['status', 'completed_at']
     search_fields = ['user__username', 'mission__title']
+
+
+@admin.register(UserMissionStats)
+class UserMissionStatsAdmin(admin.ModelAdmin):
+    list_display = ['user', 'ongoing', 'weekly_completed', 'total_completed', 'week_start', 'updated_at']
+    search_fields = ['user__username']
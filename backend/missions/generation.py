@@ -0,0 +1,75 @@
+from django.db import transaction
+
+from places.models import Place
+
+from .models import Mission, UserMission
+
+MISSION_PLACE_LIMIT = 20   # 한 번에 미션을 만드는 최대 장소 수
+
+
+def difficulty_for(distance):
+    """거리에 따른 난이도 결정"""
+    if distance < 2:
+        return 'easy'
+    if distance < 5:
+        return 'normal'
+    return 'hard'
+
+
+def build_mission(place, distance):
+    difficulty = difficulty_for(distance)
+    points_info = Mission.calculate_points(distance, difficulty)
+    return Mission(
+        place=place,
+        title=f'{place.name} 방문하기',
+        description=f'{place.address}에 위치한 {place.name}을 방문하세요!',
+        difficulty=difficulty,
+        base_points=points_info['base_points'],
+        distance_bonus=points_info['distance_bonus'],
+        difficulty_bonus=points_info['difficulty_bonus'],
+    )
+
+
+def generate_missions(user, lat, lon, limit=MISSION_PLACE_LIMIT):
+    """
+    (lat, lon)에서 가까운 장소 limit개에 미션이 없으면 만들고, 사용자 목록에 없는 미션을 추가한다.
+    장소 조회(반경 확장 포함 최대 NEAREST_MAX_STEPS + 1번) + 미션 조회/생성 + 사용자 미션 조회/생성으로,
+    미션 수와 관계없이 쿼리 수가 일정하다. 장소당 미션은 하나(unique 제약)라 동시에 요청해도 중복되지 않는다.
+    반환: (새로 만든 미션 수, 사용자에게 새로 추가한 미션 수)
+    """
+    places = Place.objects.nearest(lat, lon, limit)
+    if not places:
+        return 0, 0
+
+    distances = {place.id: round(place.distance, 2) for place in places}
+
+    with transaction.atomic():
+        missions = {mission.place_id: mission for mission in Mission.objects.filter(place__in=places)}
+
+        new_missions = [
+            build_mission(place, distances[place.id])
+            for place in places
+            if place.id not in missions
+        ]
+        if new_missions:
+            # 다른 요청이 먼저 만든 미션은 건너뛰고, 만든 뒤 한 번에 다시 읽는다 (SQLite는 pk를 돌려주지 않음)
+            Mission.objects.bulk_create(new_missions, ignore_conflicts=True)
+            missions.update(
+                (mission.place_id, mission)
+                for mission in Mission.objects.filter(place_id__in=[m.place_id for m in new_missions])
+            )
+
+        active = [mission for mission in missions.values() if mission.is_active]
+        assigned = set(
+            UserMission.objects
+            .filter(user=user, mission__in=active)
+            .values_list('mission_id', flat=True)
+        )
+        new_user_missions = [
+            UserMission(user=user, mission=mission, distance_from_user=distances[mission.place_id])
+            for mission in active
+            if mission.id not in assigned
+        ]
+        UserMission.objects.bulk_create(new_user_missions, ignore_conflicts=True)
+
+    return len(new_missions), len(new_user_missions)
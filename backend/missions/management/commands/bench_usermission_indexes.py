@@ -0,0 +1,186 @@
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count
+
+from missions.models import Mission, UserMission, current_week_start
+from places.models import Place
+
+# 0004 마이그레이션에서 추가한 복합 인덱스 (이것만 빼고/넣고 비교)
+COMPOSITE_INDEXES = tuple(index.name for index in UserMission._meta.indexes)
+
+
+def schema_sql():
+    """Django가 실제로 만드는 CREATE TABLE / CREATE INDEX 문 (장소, 미션, 사용자 미션)"""
+    with connection.schema_editor(collect_sql=True) as editor:
+        for model in (Place, Mission, UserMission):
+            editor.create_model(model)
+    return editor.collected_sql
+
+
+def to_sqlite(queryset):
+    """QuerySet → sqlite3에서 바로 실행할 (sql, params)"""
+    sql, params = queryset.query.sql_with_params()
+    params = [
+        connection.ops.adapt_datetimefield_value(p) if isinstance(p, datetime) else p
+        for p in params
+    ]
+    return sql.replace('%s', '?'), params
+
+
+def hot_queries(user_id):
+    """API가 실제로 보내는 조회 (미션 목록 두 가지 + 주간/전체 완료 수)"""
+    completed = UserMission.objects.filter(user_id=user_id, status='completed').order_by()
+    return {
+        '도전 가능 목록': UserMission.objects.filter(
+            user_id=user_id, status='available', mission__is_active=True,
+        ).select_related('mission__place'),
+        '진행중 목록': UserMission.objects.filter(
+            user_id=user_id, status='ongoing',
+        ).select_related('mission__place'),
+        '이번주 완료 수': completed.filter(
+            completed_at__gte=current_week_start(),
+        ).values('user').annotate(n=Count('id')),
+        '전체 완료 수': completed.values('user').annotate(n=Count('id')),
+    }
+
+
+class Command(BaseCommand):
+    help = 'UserMission 복합 인덱스 유무에 따른 쿼리 계획과 응답 시간을 비교합니다 (임시 SQLite 파일 사용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1000000,
+            help='만들 UserMission 행 수',
+        )
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=10000,
+            help='사용자 수 (사용자당 rows / users개 미션)',
+        )
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=200,
+            help='쿼리마다 측정할 무작위 사용자 수',
+        )
+        parser.add_argument(
+            '--path',
+            help='벤치마크용 SQLite 파일 경로 (기본: 임시 파일, 끝나면 삭제)',
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        users = max(1, min(options['users'], rows))
+        per_user = -(-rows // users)
+        path = options['path'] or tempfile.mkstemp(suffix='.sqlite3')[1]
+
+        statements = schema_sql()
+        base = [sql for sql in statements if not any(f'"{name}"' in sql for name in COMPOSITE_INDEXES)]
+        composite = [sql for sql in statements if sql not in base]
+
+        db = sqlite3.connect(path)
+        try:
+            self.stdout.write(f'📦 {path}에 사용자 {users}명 × 미션 {per_user}개 생성 중...')
+            start = time.perf_counter()
+            for sql in base:
+                db.execute(sql)
+            self.seed(db, rows, users, per_user)
+            self.stdout.write(f'   {time.perf_counter() - start:.1f}s')
+
+            rng = random.Random(1)
+            sample = [rng.randint(1, users) for _ in range(options['samples'])]
+
+            before = self.run_queries(db, sample, '인덱스 없음 (기존)')
+            start = time.perf_counter()
+            for sql in composite:
+                db.execute(sql)
+            self.stdout.write(f'\n🔧 복합 인덱스 생성: {time.perf_counter() - start:.1f}s')
+            after = self.run_queries(db, sample, '복합 인덱스 적용 후')
+
+            self.stdout.write('\n요약 (사용자 1명당 평균)')
+            for label in before:
+                self.stdout.write(
+                    f'  {label:<10}: {before[label] * 1000:8.3f} ms → {after[label] * 1000:8.3f} ms '
+                    f'({before[label] / after[label]:.1f}배)'
+                )
+        finally:
+            db.close()
+            if not options['path']:
+                os.remove(path)
+
+    def seed(self, db, rows, users, per_user):
+        rng = random.Random(0)
+        missions = max(per_user, 1000)
+        now = datetime.now()
+        fmt = connection.ops.adapt_datetimefield_value
+
+        db.executemany(
+            'INSERT INTO places_place (id, name, address, facilities_raw, contact, latitude, longitude) '
+            'VALUES (?, ?, "", "", "", ?, ?)',
+            ((i, f'장소{i}', 36.8 + rng.uniform(-0.1, 0.1), 127.1 + rng.uniform(-0.1, 0.1))
+             for i in range(1, missions + 1)),
+        )
+        db.executemany(
+            'INSERT INTO missions_mission (id, place_id, title, description, difficulty, base_points, '
+            'distance_bonus, difficulty_bonus, is_active, created_at) '
+            'VALUES (?, ?, ?, "", "normal", 100, 0, 0, ?, ?)',
+            ((i, i, f'미션{i}', rng.random() > 0.05, fmt(now)) for i in range(1, missions + 1)),
+        )
+
+        def user_missions():
+            made = 0
+            for user_id in range(1, users + 1):
+                for mission_id in rng.sample(range(1, missions + 1), min(per_user, rows - made)):
+                    roll = rng.random()
+                    started = completed = None
+                    points = 0
+                    if roll < 0.7:
+                        status = 'available'
+                    else:
+                        started = now - timedelta(days=rng.uniform(0, 60))
+                        if roll < 0.75:
+                            status = 'ongoing'
+                        else:
+                            status = 'completed'
+                            completed = started + timedelta(hours=rng.uniform(0, 48))
+                            points = 150
+                    yield (user_id, mission_id, status, rng.uniform(0, 10),
+                           started and fmt(started), completed and fmt(completed), points)
+                    made += 1
+                if made >= rows:
+                    return
+
+        db.executemany(
+            'INSERT INTO missions_usermission (user_id, mission_id, status, distance_from_user, '
+            'started_at, completed_at, points_earned) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            user_missions(),
+        )
+        db.commit()
+
+    def run_queries(self, db, sample, title):
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\n== {title} =='))
+        timings = {}
+        for label in hot_queries(sample[0]):
+            sql, params = to_sqlite(hot_queries(sample[0])[label])
+            plan = db.execute(f'EXPLAIN QUERY PLAN {sql}', params).fetchall()
+            self.stdout.write(f'[{label}]')
+            for row in plan:
+                self.stdout.write(f'    {row[-1]}')
+
+            queries = [to_sqlite(hot_queries(user_id)[label]) for user_id in sample]
+            start = time.perf_counter()
+            for sql, params in queries:
+                db.execute(sql, params).fetchall()
+            timings[label] = (time.perf_counter() - start) / len(queries)
+            self.stdout.write(f'    평균 {timings[label] * 1000:.3f} ms')
+        return timings
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from missions.models import UserMissionStats
+
+
+class Command(BaseCommand):
+    help = 'UserMission에서 사용자별 미션 통계(UserMissionStats)를 다시 계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='특정 사용자 id만 다시 계산 (여러 번 지정 가능)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 저장할 행 수',
+        )
+
+    def handle(self, *args, **options):
+        count = UserMissionStats.rebuild(
+            user_ids=options['user_ids'],
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'{count}명의 미션 통계를 다시 계산했습니다.'))
@@ -0,0 +1,111 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections
+
+from accounts.models import EXP_PER_LEVEL, UserProfile
+from missions.models import Mission, UserMission, UserMissionStats
+from places.models import Place
+
+
+def complete(user_mission_id):
+    """다른 요청처럼 행을 새로 읽어서 완료 (스레드마다 DB 연결 따로)"""
+    try:
+        return UserMission.objects.select_related('mission').get(pk=user_mission_id).complete_mission()
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = '같은 사용자의 미션을 여러 스레드에서 동시에 완료해 포인트/레벨이 빠짐없이 쌓이는지 확인합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--missions',
+            type=int,
+            default=100,
+            help='임시로 만들 진행중 미션 수',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=2,
+            help='미션마다 동시에 보낼 완료 요청 수 (보상은 한 번만 지급되어야 함)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=16,
+            help='동시에 실행할 스레드 수',
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='끝난 뒤 임시 사용자/장소/미션을 지우지 않음',
+        )
+
+    def handle(self, *args, **options):
+        tag = f'stress-{uuid.uuid4().hex[:8]}'
+        user = User.objects.create_user(username=tag)
+        Place.objects.bulk_create([
+            Place(name=f'{tag}-{i}', address='', facilities_raw='', contact='')
+            for i in range(options['missions'])
+        ])
+        places = Place.objects.filter(name__startswith=tag)
+
+        try:
+            Mission.objects.bulk_create([
+                Mission(place=place, title=place.name, description='', base_points=100 + place.pk % 50)
+                for place in places
+            ])
+            missions = list(Mission.objects.filter(place__in=places))
+            UserMission.objects.bulk_create([
+                UserMission(user=user, mission=mission, status='ongoing') for mission in missions
+            ])
+            UserMissionStats.rebuild(user_ids=[user.pk])
+            ids = list(UserMission.objects.filter(user=user).values_list('pk', flat=True))
+
+            self.stdout.write(
+                f'👟 미션 {len(ids)}개 × 요청 {options["repeat"]}번을 스레드 {options["workers"]}개로 완료 중...'
+            )
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+                results = list(executor.map(complete, ids * options['repeat']))
+            elapsed = time.perf_counter() - start
+
+            self.report(user, missions, results, elapsed)
+        except OperationalError as e:
+            raise CommandError(f'DB 오류: {e}')
+        finally:
+            if not options['keep']:
+                user.delete()
+                places.delete()
+
+    def report(self, user, missions, results, elapsed):
+        profile = UserProfile.objects.get(user=user)
+        stats = UserMissionStats.for_user(user.pk)
+
+        expected_points = sum(mission.total_points for mission in missions)
+        expected_exp = sum(mission.total_points // 10 for mission in missions)
+        expected = {
+            '성공한 완료 요청': (results.count(True), len(missions)),
+            '총 포인트': (profile.total_points, expected_points),
+            '레벨': (profile.level, 1 + expected_exp // EXP_PER_LEVEL),
+            '경험치': (profile.experience, expected_exp % EXP_PER_LEVEL),
+            '완료 통계': (stats.total_completed, len(missions)),
+            '진행중 통계': (stats.ongoing, 0),
+        }
+
+        self.stdout.write(f'   {len(results)}건, {elapsed:.2f}s')
+        failed = False
+        for label, (actual, wanted) in expected.items():
+            ok = actual == wanted
+            failed = failed or not ok
+            self.stdout.write(f'  {"✅" if ok else "❌"} {label}: {actual} (기대값 {wanted})')
+
+        if failed:
+            raise CommandError('동시 완료 중 값이 누락되거나 중복 지급되었습니다.')
+        self.stdout.write(self.style.SUCCESS('포인트/레벨이 빠짐없이 한 번씩 반영되었습니다.'))
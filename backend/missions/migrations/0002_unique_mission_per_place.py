@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:48
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_missions(apps, schema_editor):
+    """같은 장소의 미션이 여러 개면 가장 먼저 만든 것만 남기고 사용자 진행 기록을 옮긴다"""
+    Mission = apps.get_model('missions', 'Mission')
+    UserMission = apps.get_model('missions', 'UserMission')
+
+    duplicated = (
+        Mission.objects.values('place_id')
+        .annotate(count=Count('id'), keep_id=Min('id'))
+        .filter(count__gt=1)
+    )
+    for row in duplicated:
+        extra_ids = list(
+            Mission.objects.filter(place_id=row['place_id'])
+            .exclude(id=row['keep_id'])
+            .values_list('id', flat=True)
+        )
+        kept_users = set(
+            UserMission.objects.filter(mission_id=row['keep_id']).values_list('user_id', flat=True)
+        )
+        for user_mission in UserMission.objects.filter(mission_id__in=extra_ids).order_by('id'):
+            if user_mission.user_id in kept_users:
+                continue
+            user_mission.mission_id = row['keep_id']
+            user_mission.save(update_fields=['mission'])
+            kept_users.add(user_mission.user_id)
+        Mission.objects.filter(id__in=extra_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('missions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_missions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='mission',
+            constraint=models.UniqueConstraint(fields=('place',), name='unique_mission_per_place'),
+        ),
+    ]
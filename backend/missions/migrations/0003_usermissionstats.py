@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:52
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('missions', '0002_unique_mission_per_place'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserMissionStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='mission_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('ongoing', models.IntegerField(default=0)),
+                ('weekly_completed', models.IntegerField(default=0)),
+                ('total_completed', models.IntegerField(default=0)),
+                ('week_start', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('missions', '0003_usermissionstats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usermission',
+            index=models.Index(fields=['user', 'status', '-started_at', '-completed_at'], name='um_user_status_started_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usermission',
+            index=models.Index(fields=['user', 'status', 'completed_at'], name='um_user_status_completed_idx'),
+        ),
+    ]
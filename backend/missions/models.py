@@ -1,9 +1,21 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
 from django.contrib.auth.models import User
+from accounts.models import UserProfile
 from places.models import Place
 from datetime import datetime, timedelta
 
 
+def current_week_start():
+    """이번주 월요일 0시"""
+    today = datetime.now()
+    week_start = today - timedelta(days=today.weekday())
+    return week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
 class Mission(models.Model):
     """미션 모델 - 특정 장소 방문하기"""
     DIFFICULTY_CHOICES = [
@@ -25,6 +37,12 @@ class Mission(models.Model):
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            # 장소당 미션은 하나 (동시에 생성해도 중복되지 않도록)
+            models.UniqueConstraint(fields=['place'], name='unique_mission_per_place'),
+        ]
+
     def __str__(self):
         return f"{self.title} ({self.get_difficulty_display()})"
 
@@ -79,31 +97,66 @@ class UserMission(models.Model):
     class Meta:
         unique_together = ['user', 'mission']
         ordering = ['-started_at', '-completed_at']
+        indexes = [
+            # 목록 조회: (user, status)로 거르고 기본 정렬 순서 그대로 읽기
+            models.Index(fields=['user', 'status', '-started_at', '-completed_at'],
+                         name='um_user_status_started_idx'),
+            # 이번주/전체 완료 수: (user, status='completed', completed_at 범위)
+            models.Index(fields=['user', 'status', 'completed_at'],
+                         name='um_user_status_completed_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.mission.title} ({self.get_status_display()})"
 
     def start_mission(self, distance_km):
-        """미션 시작"""
+        """미션 시작. 도전 가능 상태가 아니면(동시에 시작/완료된 경우 포함) False"""
+        started_at = datetime.now()
+
+        with transaction.atomic():
+            # 아직 도전 가능할 때만 시작 (동시에 두 번 시작해도 진행중 카운터는 한 번만 올린다.
+            # 이미 완료된 미션을 다시 진행중으로 돌려 보상을 또 받지 않도록 completed도 제외)
+            updated = UserMission.objects.filter(pk=self.pk, status='available').update(
+                status='ongoing',
+                distance_from_user=distance_km,
+                started_at=started_at,
+            )
+            if not updated:
+                return False
+
+            UserMissionStats.record(self.user_id, ongoing=1)
+
         self.status = 'ongoing'
         self.distance_from_user = distance_km
-        self.started_at = datetime.now()
-        self.save()
+        self.started_at = started_at
+        return True
 
     def complete_mission(self):
         """미션 완료 및 보상 지급"""
         if self.status != 'ongoing':
             return False
 
-        self.status = 'completed'
-        self.completed_at = datetime.now()
-        self.points_earned = self.mission.total_points
-        self.save()
+        points = self.mission.total_points
+        completed_at = datetime.now()
+
+        with transaction.atomic():
+            # 아직 진행중일 때만 완료 처리 (같은 미션을 동시에 완료해도 보상은 한 번)
+            updated = UserMission.objects.filter(pk=self.pk, status='ongoing').update(
+                status='completed',
+                completed_at=completed_at,
+                points_earned=points,
+            )
+            if not updated:
+                return False
 
-        # 사용자 프로필에 경험치/포인트 추가
-        profile = self.user.profile
-        profile.add_points(self.points_earned)
+            UserMissionStats.record(self.user_id, ongoing=-1, completed=1, weekly=1)
 
+            # 사용자 프로필에 경험치/포인트 추가
+            UserProfile.grant_points(self.user_id, points)
+
+        self.status = 'completed'
+        self.completed_at = completed_at
+        self.points_earned = points
         return True
 
     def cancel_mission(self):
@@ -111,39 +164,139 @@ class UserMission(models.Model):
         if self.status != 'ongoing':
             return False
 
+        with transaction.atomic():
+            # 아직 진행중일 때만 되돌린다 (동시에 완료된 미션을 available로 덮어쓰지 않고, 카운터도 한 번만 뺀다)
+            updated = UserMission.objects.filter(pk=self.pk, status='ongoing').update(
+                status='available',
+                started_at=None,
+                completed_at=None,
+                points_earned=0,
+                distance_from_user=None,
+            )
+            if not updated:
+                return False
+
+            UserMissionStats.record(self.user_id, ongoing=-1)
+
         self.status = 'available'
         self.started_at = None
         self.completed_at = None
         self.points_earned = 0
         self.distance_from_user = None
-        self.save(update_fields=[
-            'status',
-            'started_at',
-            'completed_at',
-            'points_earned',
-            'distance_from_user',
-        ])
         return True
 
     @classmethod
     def get_user_stats(cls, user):
-        """사용자 미션 통계"""
-        ongoing_count = cls.objects.filter(user=user, status='ongoing').count()
-        total_completed = cls.objects.filter(user=user, status='completed').count()
+        """사용자 미션 통계 (UserMissionStats 한 행 조회)"""
+        return UserMissionStats.for_user(user.pk).as_dict()
+
 
-        # 이번주 완료 (월요일 기준)
-        today = datetime.now()
-        week_start = today - timedelta(days=today.weekday())
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+class UserMissionStats(models.Model):
+    """
+    사용자별 미션 통계 카운터 (UserMission 상태가 바뀔 때 같은 트랜잭션에서 갱신).
+    weekly_completed는 week_start 주의 완료 수이며, 주가 바뀌면 0부터 다시 센다.
+    어긋났을 때는 'python manage.py rebuild_mission_stats'로 UserMission에서 다시 계산한다.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True,
+                                related_name='mission_stats')
+    ongoing = models.IntegerField(default=0)
+    weekly_completed = models.IntegerField(default=0)
+    total_completed = models.IntegerField(default=0)
+    week_start = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
-        weekly_completed = cls.objects.filter(
-            user=user,
-            status='completed',
-            completed_at__gte=week_start
-        ).count()
+    def __str__(self):
+        return f"{self.user_id} - 진행중 {self.ongoing}, 완료 {self.total_completed}"
 
+    def as_dict(self):
+        # 지난주에 마지막으로 갱신됐다면 이번주 완료는 아직 0
+        weekly = self.weekly_completed if self.week_start == current_week_start().date() else 0
         return {
-            'ongoing': ongoing_count,
-            'weekly_completed': weekly_completed,
-            'total_completed': total_completed,
+            'ongoing': self.ongoing,
+            'weekly_completed': weekly,
+            'total_completed': self.total_completed,
+        }
+
+    @classmethod
+    def for_user(cls, user_id):
+        stats = cls.objects.filter(pk=user_id).first()
+        if stats is None:
+            cls.rebuild(user_ids=[user_id])
+            stats = cls.objects.get(pk=user_id)
+        return stats
+
+    @classmethod
+    def record(cls, user_id, ongoing=0, completed=0, weekly=0, create_missing=True):
+        """카운터에 변화량을 더한다 (F() 갱신이라 동시에 호출돼도 값을 잃지 않는다)"""
+        week_start = current_week_start().date()
+        changes = {
+            'ongoing': F('ongoing') + ongoing,
+            'total_completed': F('total_completed') + completed,
         }
+        if weekly:
+            changes['weekly_completed'] = Case(
+                When(week_start=week_start, then=F('weekly_completed') + weekly),
+                default=Value(max(weekly, 0)),
+            )
+            changes['week_start'] = week_start
+
+        if not cls.objects.filter(pk=user_id).update(**changes) and create_missing:
+            # 아직 행이 없는 사용자는 (방금 바뀐 상태까지 포함해) 처음부터 계산
+            cls.rebuild(user_ids=[user_id])
+
+    @classmethod
+    def rebuild(cls, user_ids=None, batch_size=1000):
+        """UserMission에서 다시 계산해 덮어쓴다. user_ids가 없으면 전체 사용자. 반영한 행 수를 반환"""
+        week_start = current_week_start()
+        user_missions = UserMission.objects.order_by()
+        if user_ids is not None:
+            user_missions = user_missions.filter(user_id__in=user_ids)
+
+        counts = {
+            row['user']: row
+            for row in user_missions.values('user').annotate(
+                ongoing=Count('id', filter=Q(status='ongoing')),
+                total_completed=Count('id', filter=Q(status='completed')),
+                weekly_completed=Count('id', filter=Q(status='completed', completed_at__gte=week_start)),
+            )
+        }
+        if user_ids is None:
+            user_ids = User.objects.values_list('id', flat=True)
+
+        rows = []
+        for user_id in user_ids:
+            row = counts.get(user_id, {})
+            rows.append(cls(
+                user_id=user_id,
+                ongoing=row.get('ongoing', 0),
+                weekly_completed=row.get('weekly_completed', 0),
+                total_completed=row.get('total_completed', 0),
+                week_start=week_start.date(),
+            ))
+
+        cls.objects.bulk_create(
+            rows,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=['ongoing', 'weekly_completed', 'total_completed', 'week_start', 'updated_at'],
+        )
+        return len(rows)
+
+
+@receiver(post_delete, sender=UserMission)
+def update_stats_on_delete(sender, instance, **kwargs):
+    """
+    UserMission이 지워지면(장소/미션 삭제로 연쇄 삭제 포함) 카운터에서 뺀다.
+    사용자 삭제 중에는 통계 행도 함께 지워지므로 없는 행을 새로 만들지 않는다.
+    """
+    if instance.status == 'ongoing':
+        UserMissionStats.record(instance.user_id, ongoing=-1, create_missing=False)
+    elif instance.status == 'completed':
+        completed_at = instance.completed_at
+        if completed_at is not None and timezone.is_aware(completed_at):
+            completed_at = timezone.make_naive(completed_at)
+        this_week = completed_at is not None and completed_at >= current_week_start()
+        UserMissionStats.record(
+            instance.user_id, completed=-1, weekly=-1 if this_week else 0, create_missing=False
+        )
@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from .models import Mission, UserMission
 from places.serializer import PlaceSerializer
+from geocode.backfill import schedule_backfill
+from config.pagination import select_fields
 
 
 class MissionSerializer(serializers.ModelSerializer):
@@ -14,6 +16,8 @@ class MissionSerializer(serializers.ModelSerializer):
                   'place_info', 'is_active']
 
     def get_place_info(self, obj):
+        if obj.place.latitude is None or obj.place.longitude is None:
+            schedule_backfill(obj.place, obj.place.address)
         return {
             'id': obj.place.id,
             'name': obj.place.name,
@@ -32,3 +36,56 @@ class UserMissionSerializer(serializers.ModelSerializer):
         fields = ['id', 'mission', 'status', 'status_display',
                   'distance_from_user', 'started_at', 'completed_at',
                   'points_earned']
+
+
+class UserMissionListSerializer(serializers.BaseSerializer):
+    """
+    목록 조회 전용(읽기 전용) 직렬화. UserMissionSerializer와 같은 모양을
+    필드 객체를 거치지 않고 바로 만든다.
+    queryset은 select_related('mission__place')로 가져와야 행마다 쿼리가 추가되지 않는다.
+    """
+
+    datetime_field = serializers.DateTimeField()
+
+    def format_datetime(self, value):
+        return None if value is None else self.datetime_field.to_representation(value)
+
+    def to_representation(self, obj):
+        fields = self.context.get('fields')
+        data = {'id': obj.id}
+        # 요청한 필드에 mission이 없으면 미션/장소 정보는 만들지 않는다
+        if fields is None or 'mission' in fields:
+            data['mission'] = self.mission_data(obj.mission)
+        data.update({
+            'status': obj.status,
+            'status_display': obj.get_status_display(),
+            'distance_from_user': obj.distance_from_user,
+            'started_at': self.format_datetime(obj.started_at),
+            'completed_at': self.format_datetime(obj.completed_at),
+            'points_earned': obj.points_earned,
+        })
+        return select_fields(data, fields)
+
+    def mission_data(self, mission):
+        place = mission.place
+        if place.latitude is None or place.longitude is None:
+            schedule_backfill(place, place.address)
+
+        return {
+            'id': mission.id,
+            'title': mission.title,
+            'description': mission.description,
+            'difficulty': mission.difficulty,
+            'base_points': mission.base_points,
+            'distance_bonus': mission.distance_bonus,
+            'difficulty_bonus': mission.difficulty_bonus,
+            'total_points': mission.total_points,
+            'place_info': {
+                'id': place.id,
+                'name': place.name,
+                'address': place.address,
+                'latitude': place.latitude,
+                'longitude': place.longitude,
+            },
+            'is_active': mission.is_active,
+        }
@@ -0,0 +1,194 @@
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APIClient
+
+from accounts.models import EXP_PER_LEVEL, UserProfile
+from places.models import Place
+
+from .generation import generate_missions
+from .models import Mission, UserMission, UserMissionStats
+
+
+class MissionListQueryCountTests(TestCase):
+    """미션 수와 상관없이 목록 조회 쿼리 수가 일정해야 한다 (N+1 회귀 방지)"""
+
+    MISSIONS = 50
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='query-count')
+        Place.objects.bulk_create([
+            Place(name=f'place-{i}', address='', facilities_raw='', contact='', latitude=37.5, longitude=127.0)
+            for i in range(cls.MISSIONS * 2)
+        ])
+        Mission.objects.bulk_create([
+            Mission(place=place, title=place.name, description='') for place in Place.objects.all()
+        ])
+        missions = list(Mission.objects.order_by('pk'))
+        UserMission.objects.bulk_create(
+            [UserMission(user=cls.user, mission=mission, status='available') for mission in missions[:cls.MISSIONS]]
+            + [UserMission(user=cls.user, mission=mission, status='ongoing') for mission in missions[cls.MISSIONS:]]
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assert_list(self, url, queries):
+        with self.assertNumQueries(queries):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), self.MISSIONS)
+        self.assertTrue(all(item['mission']['place_info']['name'] for item in response.json()))
+        return response.json()
+
+    def test_available_missions(self):
+        missions = self.assert_list('/api/missions/available/', 1)
+        self.assertEqual(missions[0]['status'], 'available')
+
+    def test_ongoing_missions(self):
+        missions = self.assert_list('/api/missions/ongoing/', 1)
+        self.assertEqual(missions[0]['status'], 'ongoing')
+
+
+class GenerateMissionsQueryCountTests(TestCase):
+    """주변 장소가 limit보다 적어도 반경을 끝없이 넓히지 않는다 (장소 조회는 최대 4번)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='generate')
+        # 서로 수십~수백 km 떨어진 5곳 (기본 limit 20보다 적음)
+        Place.objects.bulk_create([
+            Place(name=f'place-{i}', address='', facilities_raw='', contact='',
+                  latitude=37.5 - i * 0.8, longitude=127.0 + i * 0.3)
+            for i in range(5)
+        ])
+
+    def test_sparse_places_bounded_queries(self):
+        # 장소 4 + savepoint 2 + 미션 조회/생성/재조회 3 + 사용자 미션 조회/생성 2
+        with self.assertNumQueries(11):
+            self.assertEqual(generate_missions(self.user, 37.5, 127.0, limit=20), (5, 5))
+        # 이미 모두 만들어진 뒤: 장소 4 + savepoint 2 + 미션 조회 1 + 사용자 미션 조회 1
+        with self.assertNumQueries(8):
+            self.assertEqual(generate_missions(self.user, 37.5, 127.0, limit=20), (0, 0))
+
+class MissionStatusRaceTests(TestCase):
+    """다른 요청이 먼저 상태를 바꾼 뒤 예전 인스턴스로 시작/취소해도 카운터와 보상이 맞아야 한다"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='race')
+        place = Place.objects.create(name='place', address='', facilities_raw='', contact='')
+        self.mission = Mission.objects.create(place=place, title='place', description='')
+        self.user_mission = UserMission.objects.create(user=self.user, mission=self.mission)
+        UserMissionStats.rebuild(user_ids=[self.user.pk])
+
+    def copy(self):
+        """같은 행을 따로 읽은 다른 요청의 인스턴스"""
+        return UserMission.objects.select_related('mission').get(pk=self.user_mission.pk)
+
+    def stats(self):
+        return UserMissionStats.for_user(self.user.pk)
+
+    def test_double_start_counts_once(self):
+        first, second = self.copy(), self.copy()
+        self.assertTrue(first.start_mission(1.0))
+        self.assertFalse(second.start_mission(1.0))
+        self.assertEqual(self.stats().ongoing, 1)
+
+    def test_cancel_after_complete_keeps_completed(self):
+        self.assertTrue(self.copy().start_mission(1.0))
+        completing, cancelling = self.copy(), self.copy()
+
+        self.assertTrue(completing.complete_mission())
+        self.assertFalse(cancelling.cancel_mission())
+
+        self.user_mission.refresh_from_db()
+        self.assertEqual(self.user_mission.status, 'completed')
+        self.assertEqual(self.stats().ongoing, 0)
+        self.assertEqual(self.stats().total_completed, 1)
+        # 완료된 미션은 다시 시작할 수 없다 (보상 중복 방지)
+        self.assertFalse(cancelling.start_mission(1.0))
+
+    def test_double_cancel_counts_once(self):
+        self.assertTrue(self.copy().start_mission(1.0))
+        first, second = self.copy(), self.copy()
+        self.assertTrue(first.cancel_mission())
+        self.assertFalse(second.cancel_mission())
+        self.assertEqual(self.stats().ongoing, 0)
+
+
+class ConcurrentCompleteMissionTests(TransactionTestCase):
+    """
+    같은 사용자의 미션을 여러 스레드에서 동시에 완료해도 보상이 빠짐없이 한 번씩 쌓여야 한다.
+    (더 큰 규모는 'python manage.py stress_complete_missions')
+    """
+
+    MISSIONS = 20
+    REPEAT = 2
+    WORKERS = 4
+
+    @classmethod
+    def setUpClass(cls):
+        # 메모리 shared-cache 테스트 DB는 스레드 동시 쓰기에서 잠금을 기다리지 않고 바로 실패(table is locked)하므로
+        # 이 클래스 동안만 임시 파일 DB로 바꾼다. 메모리 DB 연결은 닫지 않고 보관했다가 되돌린다.
+        cls.saved_database = None
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            cls.saved_database = (connection.settings_dict['NAME'], connection.connection)
+            cls.file_database_dir = tempfile.mkdtemp()
+            connection.connection = None
+            connection.settings_dict['NAME'] = str(Path(cls.file_database_dir) / 'concurrency.sqlite3')
+            call_command('migrate', verbosity=0, interactive=False)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        if cls.saved_database is not None:
+            connection.close()
+            connection.settings_dict['NAME'], connection.connection = cls.saved_database
+            shutil.rmtree(cls.file_database_dir, ignore_errors=True)
+
+    def complete(self, user_mission_id):
+        # 다른 요청처럼 행을 새로 읽어서 완료 (스레드마다 DB 연결 따로)
+        try:
+            return UserMission.objects.select_related('mission').get(pk=user_mission_id).complete_mission()
+        finally:
+            connections.close_all()
+
+    def test_rewards_granted_once_per_mission(self):
+        user = User.objects.create_user(username='concurrent')
+        Place.objects.bulk_create([
+            Place(name=f'place-{i}', address='', facilities_raw='', contact='') for i in range(self.MISSIONS)
+        ])
+        Mission.objects.bulk_create([
+            Mission(place=place, title=place.name, description='', base_points=100 + place.pk % 50)
+            for place in Place.objects.all()
+        ])
+        missions = list(Mission.objects.all())
+        UserMission.objects.bulk_create([
+            UserMission(user=user, mission=mission, status='ongoing') for mission in missions
+        ])
+        UserMissionStats.rebuild(user_ids=[user.pk])
+        ids = list(UserMission.objects.filter(user=user).values_list('pk', flat=True))
+
+        with ThreadPoolExecutor(max_workers=self.WORKERS) as executor:
+            results = list(executor.map(self.complete, ids * self.REPEAT))
+
+        profile = UserProfile.objects.get(user=user)
+        stats = UserMissionStats.for_user(user.pk)
+        expected_points = sum(mission.total_points for mission in missions)
+        expected_exp = sum(mission.total_points // 10 for mission in missions)
+
+        self.assertEqual(results.count(True), self.MISSIONS)
+        self.assertEqual(profile.total_points, expected_points)
+        self.assertEqual(profile.level, 1 + expected_exp // EXP_PER_LEVEL)
+        self.assertEqual(profile.experience, expected_exp % EXP_PER_LEVEL)
+        self.assertEqual(stats.total_completed, self.MISSIONS)
+        self.assertEqual(stats.ongoing, 0)
@@ -2,11 +2,11 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
+from .generation import generate_missions
 from .models import Mission, UserMission
-from .serializers import MissionSerializer, UserMissionSerializer
-from places.models import Place
+from .serializers import MissionSerializer, UserMissionListSerializer, UserMissionSerializer
+from config.pagination import OptInCursorPagination, parse_fields
 from places.views import calculate_distance
-import math
 
 
 class GenerateMissionsView(APIView):
@@ -20,54 +20,36 @@ class GenerateMissionsView(APIView):
         if lat == 0 or lon == 0:
             return Response({'error': '위치 정보가 필요합니다.'}, status=400)
 
-        # 좌표가 있는 모든 장소 가져오기
-        places = Place.objects.exclude(latitude__isnull=True).exclude(longitude__isnull=True)
-
-        created_count = 0
-        for place in places[:20]:  # 최대 20개 장소
-            distance = calculate_distance(lat, lon, place.latitude, place.longitude)
-
-            # 거리에 따른 난이도 결정
-            if distance < 2:
-                difficulty = 'easy'
-            elif distance < 5:
-                difficulty = 'normal'
-            else:
-                difficulty = 'hard'
-
-            # 점수 계산
-            points_info = Mission.calculate_points(distance, difficulty)
-
-            # 미션이 이미 존재하는지 확인
-            mission, created = Mission.objects.get_or_create(
-                place=place,
-                defaults={
-                    'title': f'{place.name} 방문하기',
-                    'description': f'{place.address}에 위치한 {place.name}을 방문하세요!',
-                    'difficulty': difficulty,
-                    'base_points': points_info['base_points'],
-                    'distance_bonus': points_info['distance_bonus'],
-                    'difficulty_bonus': points_info['difficulty_bonus'],
-                }
-            )
-
-            if created:
-                created_count += 1
-
-                # 사용자의 미션 목록에 추가
-                UserMission.objects.get_or_create(
-                    user=request.user,
-                    mission=mission,
-                    defaults={'distance_from_user': distance}
-                )
+        # 가까운 장소의 미션을 한 번에 만들고 사용자 목록에 추가
+        created_count, assigned_count = generate_missions(request.user, lat, lon)
 
         return Response({
             'message': f'{created_count}개의 새로운 미션이 생성되었습니다.',
+            'assigned_missions': assigned_count,
             'total_missions': Mission.objects.filter(is_active=True).count()
         })
 
 
-class AvailableMissionsView(APIView):
+class UserMissionListMixin:
+    """
+    미션 목록 공통 응답.
+    ?cursor / ?page_size가 있으면 커서 페이지네이션({next, previous, results}), 없으면 전체 배열.
+    ?fields=id,status,mission.title 처럼 필요한 필드만 고를 수 있다.
+    """
+
+    def list_response(self, request, user_missions):
+        context = {'fields': parse_fields(request)}
+        paginator = OptInCursorPagination()
+        if paginator.is_requested(request):
+            page = paginator.paginate_queryset(user_missions, request, view=self)
+            serializer = UserMissionListSerializer(page, many=True, context=context)
+            return paginator.get_paginated_response(serializer.data)
+
+        serializer = UserMissionListSerializer(user_missions, many=True, context=context)
+        return Response(serializer.data)
+
+
+class AvailableMissionsView(UserMissionListMixin, APIView):
     """도전 가능한 미션 목록"""
     permission_classes = [IsAuthenticated]
 
@@ -76,12 +58,11 @@ class AvailableMissionsView(APIView):
             user=request.user,
             status='available',
             mission__is_active=True
-        )
-        serializer = UserMissionSerializer(user_missions, many=True)
-        return Response(serializer.data)
+        ).select_related('mission__place')
+        return self.list_response(request, user_missions)
 
 
-class OngoingMissionsView(APIView):
+class OngoingMissionsView(UserMissionListMixin, APIView):
     """진행중인 미션 목록"""
     permission_classes = [IsAuthenticated]
 
@@ -89,9 +70,8 @@ class OngoingMissionsView(APIView):
         user_missions = UserMission.objects.filter(
             user=request.user,
             status='ongoing'
-        )
-        serializer = UserMissionSerializer(user_missions, many=True)
-        return Response(serializer.data)
+        ).select_related('mission__place')
+        return self.list_response(request, user_missions)
 
 
 class StartMissionView(APIView):
@@ -115,9 +95,11 @@ class StartMissionView(APIView):
                     user_mission.mission.place.latitude,
                     user_mission.mission.place.longitude
                 )
-                user_mission.start_mission(distance)
             else:
-                user_mission.start_mission(0)
+                distance = 0
+
+            if not user_mission.start_mission(distance):
+                return Response({'error': '미션을 시작할 수 없습니다.'}, status=400)
 
             serializer = UserMissionSerializer(user_mission)
             return Response(serializer.data)
@@ -1,6 +1,9 @@
 from django.db import models
 import re
 
+from geocode.querysets import GeoQuerySet
+from geocode.response_cache import NearbyCache
+
 
 class Place(models.Model):
     name = models.CharField(max_length=100)
@@ -12,6 +15,13 @@ class Place(models.Model):
     latitude = models.FloatField(blank=True, null=True)
     longitude = models.FloatField(blank=True, null=True)
 
+    objects = GeoQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["latitude", "longitude"]),
+        ]
+
     @property
     def facilities(self):
         # 파일 원본 문자열을 리스트로 변환
@@ -34,4 +44,8 @@ class Place(models.Model):
         super().save(*args, **kwargs)
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+
+# 주변 장소 조회 응답 캐시 (행 저장/삭제 시 자동 무효화)
+nearby_cache = NearbyCache(Place)
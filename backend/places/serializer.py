@@ -1,20 +1,16 @@
 from rest_framework import serializers
 from .models import Place
-from geocode.utils import geocode_address
+from geocode.backfill import schedule_backfill
 
 
 class PlaceSerializer(serializers.ModelSerializer):
-    latitude = serializers.SerializerMethodField()
-    longitude = serializers.SerializerMethodField()
-
     class Meta:
         model = Place
         fields = ['id', 'name', 'address', 'latitude', 'longitude']
+        read_only_fields = ['latitude', 'longitude']
 
-    def get_latitude(self, obj):
-        lat, lng = geocode_address(obj.address)
-        return lat
-
-    def get_longitude(self, obj):
-        lat, lng = geocode_address(obj.address)
-        return lng
\ No newline at end of file
+    def to_representation(self, obj):
+        # 저장된 좌표를 그대로 내려주고, 비어 있으면 외부 API 호출은 백그라운드로 미룬다
+        if obj.latitude is None or obj.longitude is None:
+            schedule_backfill(obj, obj.address)
+        return super().to_representation(obj)
@@ -1,3 +1,51 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from geocode.querysets import NEAREST_MAX_STEPS
+
+from .models import Place
+
+
+class NearbyPaginationQueryCountTests(TestCase):
+    """마지막 페이지나 드문 지역에서도 페이지당 쿼리 수가 일정해야 한다"""
+
+    PLACES = 12
+    PAGE_SIZE = 5
+    # 캐시 버전(DataVersion) 1 + 장소 조회 최대 NEAREST_MAX_STEPS + 1
+    MAX_QUERIES = 1 + NEAREST_MAX_STEPS + 1
+
+    @classmethod
+    def setUpTestData(cls):
+        # 가까운 곳부터 수백 km 떨어진 곳까지 흩어 놓는다
+        Place.objects.bulk_create([
+            Place(name=f'place-{i}', address='', facilities_raw='', contact='',
+                  latitude=37.5 - i * 0.4, longitude=127.0 + i * 0.1)
+            for i in range(cls.PLACES)
+        ])
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_walk_pages(self):
+        url = f'/api/nearby?lat=37.5&lon=127.0&limit={self.PAGE_SIZE}&cursor='
+        seen = []
+        pages = 0
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(queries), self.MAX_QUERIES, f'{pages + 1}번째 페이지')
+
+            body = response.json()
+            seen.extend(place['id'] for place in body['results'])
+            url = body['next']
+            pages += 1
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(len(seen), self.PLACES)
+        self.assertEqual(len(set(seen)), self.PLACES)
+        distances = [Place.objects.get(pk=pk).latitude for pk in seen]
+        self.assertEqual(distances, sorted(distances, reverse=True))
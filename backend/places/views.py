@@ -1,71 +1,92 @@
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from .models import Place
-import math
+from .models import Place, nearby_cache
+from geocode.geo import haversine
+from config.pagination import decode_cursor, next_page_url, parse_fields
 
 
 def calculate_distance(lat1, lon1, lat2, lon2):
-    """두 좌표 사이의 거리를 계산 (km 단위)"""
-    R = 6371  # 지구 반지름 (km)
-
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lon = math.radians(lon2 - lon1)
-
-    a = math.sin(delta_lat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-    distance = R * c
-    return round(distance, 2)
+    """두 좌표 사이의 거리를 계산 (km 단위, 소수 둘째 자리 반올림)"""
+    return round(haversine(lat1, lon1, lat2, lon2), 2)
+
+
+MAX_NEARBY_LIMIT = 100
+
+# 응답 필드별 값 계산 (?fields=로 고른 필드만 계산한다. facilities는 문자열 분리가 필요)
+NEARBY_PLACE_FIELDS = {
+    'id': lambda place: place.id,
+    'name': lambda place: place.name,
+    'address': lambda place: place.address,
+    'lat': lambda place: place.latitude,
+    'lon': lambda place: place.longitude,
+    'distance': lambda place: round(place.distance, 2),
+    'contact': lambda place: place.contact,
+    'facilities': lambda place: place.facilities,
+}
+
+
+def find_nearby_places(lat, lon, limit, fields=None, after=None):
+    """
+    가까운 순 limit개의 응답 행과, 다음 페이지가 있으면 그 커서 (distance, id)를 반환한다.
+    after가 주어지면 그 커서 다음부터 찾는다.
+    """
+    # 위경도 인덱스로 주변 사각형만 조회해 가까운 순 limit개 (같은 좌표는 하나만)
+    # 다음 페이지가 있는지 알기 위해 하나 더 가져온다
+    places = Place.objects.nearest(lat, lon, limit + 1, unique_location=True, after=after)
+    has_more = len(places) > limit
+    places = places[:limit]
+
+    getters = [
+        (name, get) for name, get in NEARBY_PLACE_FIELDS.items()
+        if fields is None or name in fields
+    ]
+    result = [{name: get(place) for name, get in getters} for place in places]
+    next_after = [places[-1].distance, places[-1].id] if has_more else None
+    return result, next_after
 
 
 @api_view(['GET'])
 def nearby_places(request):
-    """주변 장소를 조회하는 API"""
+    """
+    주변 장소를 조회하는 API
+      - lat, lon: 필수. limit: 선택 (기본 5, 최대 100)
+      - fields: 선택. 예) fields=id,name,distance
+      - cursor: 선택. 주면(빈 값 포함) {results, next} 형태로 다음 페이지 URL을 함께 준다.
+    """
     try:
         lat = float(request.GET.get('lat', 0))
         lon = float(request.GET.get('lon', 0))
-        limit = int(request.GET.get('limit', 5))
+        limit = max(1, min(int(request.GET.get('limit', 5)), MAX_NEARBY_LIMIT))
 
         if lat == 0 or lon == 0:
             return Response({'error': '위도(lat)와 경도(lon)를 제공해주세요.'}, status=400)
 
-        # 좌표가 있는 모든 장소 가져오기
-        places = Place.objects.exclude(latitude__isnull=True).exclude(longitude__isnull=True)
-
-        # 거리 계산 및 중복 제거
-        seen_locations = set()
-        places_with_distance = []
-
-        for place in places:
-            # 같은 좌표를 가진 장소는 하나만 표시 (중복 제거)
-            location_key = (place.latitude, place.longitude)
-            if location_key in seen_locations:
-                continue
-            seen_locations.add(location_key)
-
-            distance = calculate_distance(lat, lon, place.latitude, place.longitude)
-            places_with_distance.append({
-                'id': place.id,
-                'name': place.name,
-                'address': place.address,
-                'lat': place.latitude,
-                'lon': place.longitude,
-                'distance': distance,
-                'contact': place.contact,
-                'facilities': place.facilities
-            })
-
-        # 거리순으로 정렬
-        places_with_distance.sort(key=lambda x: x['distance'])
-
-        # limit 적용
-        result = places_with_distance[:limit]
-
-        return Response(result)
-
-    except ValueError:
+        fields = parse_fields(request)
+        paginate = 'cursor' in request.GET
+        cursor = request.GET.get('cursor')
+        after = None
+        if cursor:
+            distance, place_id = decode_cursor(cursor)
+            after = (float(distance), int(place_id))
+
+        (result, next_after), hit = nearby_cache.get_or_compute(
+            lat, lon,
+            lambda lat, lon: find_nearby_places(lat, lon, limit, fields, after),
+            limit=limit,
+            fields=','.join(sorted(fields)) if fields else '',
+            after=cursor or '',
+        )
+        headers = {'X-Cache': 'HIT' if hit else 'MISS'}
+
+        if not paginate:
+            return Response(result, headers=headers)
+
+        return Response({
+            'results': result,
+            'next': next_page_url(request, next_after) if next_after else None,
+        }, headers=headers)
+
+    except (ValueError, TypeError):
         return Response({'error': '잘못된 파라미터 형식입니다.'}, status=400)
     except Exception as e:
         return Response({'error': str(e)}, status=500)
@@ -0,0 +1,137 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+
+
+class UpstreamError(Exception):
+    """OpenWeatherMap이 오류 응답을 준 경우 (상태 코드와 본문을 그대로 전달)"""
+
+    def __init__(self, status, body):
+        super().__init__(f"OpenWeatherMap {status}")
+        self.status = status
+        self.body = body
+
+
+def tile_of(lat, lon, tile_deg=None):
+    """좌표를 tile_deg 간격 타일의 중심점으로 맞춘다 (같은 타일 = 같은 날씨)"""
+    tile_deg = tile_deg or settings.WEATHER_TILE_DEG
+    return (
+        round(round(lat / tile_deg) * tile_deg, 6),
+        round(round(lon / tile_deg) * tile_deg, 6),
+    )
+
+
+class SingleFlight:
+    """
+    같은 key로 동시에 들어온 호출은 하나만 실제로 실행하고 나머지는 그 결과(또는 예외)를 함께 기다린다.
+    WSGI에서는 요청마다 이벤트 루프가 다르므로, 결과는 루프와 무관한 concurrent.futures.Future로 나눈다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}    # key -> concurrent.futures.Future
+        self._tasks = set()  # 실행 중인 태스크가 GC되지 않도록 참조 유지
+
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._calls
+
+    def _join(self, key):
+        """(key의 Future, 새로 시작해야 하는지)"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = self._calls[key] = concurrent.futures.Future()
+            return future, True
+
+    def _finish(self, key):
+        with self._lock:
+            self._calls.pop(key, None)
+
+    async def _lead(self, key, func, future):
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            self._finish(key)
+            future.cancel()
+            raise
+        except Exception as e:
+            self._finish(key)
+            future.set_exception(e)
+        else:
+            self._finish(key)
+            future.set_result(result)
+
+    async def do(self, key, func):
+        future, leader = self._join(key)
+        if leader:
+            task = asyncio.ensure_future(self._lead(key, func, future))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        # 기다리던 요청 하나가 취소돼도 공유 호출은 계속 진행되도록 shield
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+
+class WeatherCache:
+    """
+    타일 단위 날씨 캐시.
+    - WEATHER_CACHE_TTL 안: 캐시 그대로 반환 (HIT)
+    - 그 뒤 WEATHER_STALE_TTL 동안: 예전 값을 바로 반환하고 백그라운드 스레드에서 갱신 (STALE)
+    - 그 이후/없음: 업스트림 호출 (MISS). 같은 타일의 동시 요청은 한 번만 호출한다.
+    """
+
+    def __init__(self, fetch):
+        self.fetch = fetch   # async fetch(lat, lon) -> dict, 실패 시 예외
+        self.flight = SingleFlight()
+
+    def key_of(self, tile):
+        return f"weather:{tile[0]}:{tile[1]}"
+
+    async def get(self, lat, lon):
+        """(날씨 dict, 'HIT' | 'STALE' | 'MISS')"""
+        tile = tile_of(lat, lon)
+        key = self.key_of(tile)
+        entry = await cache.aget(key)
+
+        if entry is not None:
+            age = time.time() - entry["fetched_at"]
+            if age < settings.WEATHER_CACHE_TTL:
+                return entry["data"], "HIT"
+            self.revalidate(key, tile)
+            return entry["data"], "STALE"
+
+        return await self.flight.do(key, lambda: self.refresh(key, tile)), "MISS"
+
+    async def refresh(self, key, tile):
+        data = await self.fetch(*tile)
+        await cache.aset(
+            key,
+            {"data": data, "fetched_at": time.time()},
+            settings.WEATHER_CACHE_TTL + settings.WEATHER_STALE_TTL,
+        )
+        return data
+
+    def revalidate(self, key, tile):
+        """
+        요청의 이벤트 루프가 아니라 별도 스레드에서 갱신한다.
+        WSGI(async_to_sync)에서는 응답이 끝나면 그 루프에 남은 태스크가 취소되기 때문.
+        """
+        if self.flight.in_flight(key):
+            return
+
+        def run():
+            try:
+                asyncio.run(self.flight.do(key, lambda: self.refresh(key, tile)))
+            except Exception as e:
+                # 갱신에 실패해도 기존 값은 STALE 기간 동안 계속 쓴다
+                print(f"날씨 갱신 실패 ({key}): {e}")
+            finally:
+                close_old_connections()
+
+        threading.Thread(target=run, name="weather-revalidate", daemon=True).start()
@@ -1,3 +1,90 @@
+import asyncio
+import time
+from unittest import mock
+
+import httpx
+import requests
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from config import clients
+
+from .cache import tile_of
+from .views import weather_cache
+
+
+class StaleRevalidateTests(TestCase):
+    """django.test.Client는 WSGI 경로(async_to_sync)로 뷰를 돌린다"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def wait_for(self, predicate, timeout=5):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.02)
+        return False
+
+    def test_stale_entry_refreshed_after_response(self):
+        lat, lon = 37.5665, 126.978
+        key = weather_cache.key_of(tile_of(lat, lon))
+        cache.set(
+            key,
+            {"data": {"name": "old"}, "fetched_at": time.time() - settings.WEATHER_CACHE_TTL - 1},
+            settings.WEATHER_CACHE_TTL + settings.WEATHER_STALE_TTL,
+        )
+
+        calls = []
+
+        async def fetch(lat, lon):
+            calls.append((lat, lon))
+            await asyncio.sleep(0.05)   # 업스트림 호출 흉내 (응답보다 늦게 끝남)
+            return {"name": "new"}
+
+        with mock.patch.object(weather_cache, "fetch", fetch):
+            response = self.client.get("/api/weather/", {"lat": lat, "lon": lon})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response["X-Cache"], "STALE")
+            self.assertEqual(response.json(), {"name": "old"})
+
+            # 응답이 끝난 뒤에도 갱신이 끝까지 진행돼야 한다
+            self.assertTrue(self.wait_for(lambda: cache.get(key)["data"] == {"name": "new"}))
+
+            response = self.client.get("/api/weather/", {"lat": lat, "lon": lon})
+            self.assertEqual(response["X-Cache"], "HIT")
+            self.assertEqual(response.json(), {"name": "new"})
+
+        self.assertEqual(len(calls), 1)
+
+
+class AsyncRequestFallbackTests(TestCase):
+    """등록된 루프가 없으면(WSGI) arequest는 동기 커넥션 풀을 쓴다"""
+
+    def make_response(self, status, body):
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response.headers["Content-Type"] = "application/json"
+        response.url = "https://example.com/data"
+        return response
+
+    def test_uses_sync_pool_without_registered_loop(self):
+        with mock.patch.object(clients, "request", return_value=self.make_response(200, b'{"ok": true}')) as request, \
+                mock.patch.object(clients, "get_async_client") as get_async_client:
+            response = async_to_sync(clients.aget)("https://example.com/data", params={"q": 1})
+
+        self.assertIsInstance(response, httpx.Response)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"ok": True})
+        request.assert_called_once_with("GET", "https://example.com/data", retries=None, params={"q": 1})
+        get_async_client.assert_not_called()
+
+    def test_timeout_raised_as_httpx_error(self):
+        with mock.patch.object(clients, "request", side_effect=requests.ConnectTimeout("timed out")):
+            with self.assertRaises(httpx.TimeoutException):
+                async_to_sync(clients.aget)("https://example.com/data")
@@ -1,8 +1,31 @@
-import requests
+import httpx
 from django.http import JsonResponse
 from django.conf import settings
 
-def get_weather(request):
+from config import clients
+
+from .cache import UpstreamError, WeatherCache
+
+WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+
+async def fetch_weather(lat, lon):
+    params = {
+        "lat": lat,
+        "lon": lon,
+        "appid": settings.OPENWEATHER_API_KEY,
+        "units": "metric",
+    }
+    res = await clients.aget(WEATHER_URL, params=params, timeout=settings.WEATHER_TIMEOUT)
+    if res.status_code != 200:
+        raise UpstreamError(res.status_code, res.json())
+    return res.json()
+
+
+weather_cache = WeatherCache(fetch_weather)
+
+
+async def get_weather(request):
     lat = request.GET.get('lat')
     lon = request.GET.get('lon')
 
@@ -10,8 +33,19 @@ def get_weather(request):
     if not lat or not lon:
         return JsonResponse({"error": "lat and lon are required"}, status=400)
 
-    api_key = settings.OPENWEATHER_API_KEY
-    url = f"https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&appid={api_key}&units=metric"
+    try:
+        lat = float(lat)
+        lon = float(lon)
+    except ValueError:
+        return JsonResponse({"error": "lat and lon must be numbers"}, status=400)
+
+    try:
+        result, cache_status = await weather_cache.get(lat, lon)
+    except UpstreamError as e:
+        return JsonResponse(e.body, status=e.status, safe=False)
+    except (httpx.HTTPError, ValueError) as e:
+        return JsonResponse({"error": f"weather upstream failed: {e}"}, status=502)
 
-    result = requests.get(url).json()
-    return JsonResponse(result)
+    response = JsonResponse(result)
+    response["X-Cache"] = cache_status
+    return response
@@ -0,0 +1,149 @@
+# batch_recommend.py
+# 여러 프로필의 운동 추천을 한 번에 계산해 NDJSON으로 저장한다. (/recommendations/batch와 같은 결과)
+#
+#   python batch_recommend.py --input profiles.ndjson --output today.ndjson
+#   python batch_recommend.py --django-db ../backend/db.sqlite3 > today.ndjson
+#   python batch_recommend.py --django-db ../backend/db.sqlite3 --url http://127.0.0.1:8000
+#
+# 입력 프로필은 {"id", "ageGroup", "sex", "heightCm", "weightKg"} 형식의
+# JSON 배열, {"profiles": [...]} 또는 한 줄에 하나씩(NDJSON).
+# --django-db를 주면 백엔드 DB의 accounts_userprofile(나이/성별/키/몸무게)에서 바로 읽는다.
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from itertools import islice
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 국민체력100 연령대 구분 (만 나이)
+AGE_GROUPS = (
+    (7, "유아기"),
+    (13, "유소년"),
+    (19, "청소년"),
+    (65, "성인"),
+)
+SEX_CODES = {"male": "M", "female": "F"}
+
+
+def age_group_for(age):
+    for upper, name in AGE_GROUPS:
+        if age < upper:
+            return name
+    return "어르신"
+
+
+def read_profiles(path):
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    with stream:
+        text = stream.read().strip()
+    if text.startswith("[") or text.startswith("{\"profiles\""):
+        data = json.loads(text)
+        return data["profiles"] if isinstance(data, dict) else data
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def read_django_profiles(db_path):
+    """백엔드 사용자 프로필 중 나이/성별/키/몸무게가 모두 있는 것만"""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            """
+            SELECT user_id, age, gender, height, weight
+            FROM accounts_userprofile
+            WHERE age IS NOT NULL AND height > 0 AND weight > 0
+            ORDER BY user_id
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            "id": user_id,
+            "ageGroup": age_group_for(age),
+            "sex": SEX_CODES[gender],
+            "heightCm": height,
+            "weightKg": weight,
+        }
+        for user_id, age, gender, height, weight in rows
+        if gender in SEX_CODES
+    ]
+
+
+def chunked(items, size):
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def stream_remote(url, profiles, chunk_size):
+    """실행 중인 API의 /recommendations/batch로 나눠 보내고 받은 줄을 그대로 흘려보낸다"""
+    import httpx
+
+    offset = 0
+    with httpx.Client(base_url=url, timeout=None) as client:
+        for chunk in chunked(profiles, chunk_size):
+            with client.stream("POST", "/recommendations/batch", json={"profiles": chunk}) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    if offset:
+                        # 조각마다 0부터 시작하는 index를 전체 입력 기준으로 맞춘다
+                        item = json.loads(line)
+                        item["index"] += offset
+                        line = json.dumps(item, ensure_ascii=False)
+                    yield line + "\n"
+            offset += len(chunk)
+
+
+def stream_local(profiles):
+    """API 서버 없이 같은 코드로 바로 계산"""
+    os.chdir(HERE)   # main.py는 fitness.db를 현재 폴더 기준으로 연다
+    sys.path.insert(0, HERE)
+    from main import BatchProfile, iter_batch_recommendations
+
+    # API와 같은 검증 (키/몸무게 > 0)을 출력을 쓰기 전에 모두 마친다
+    return iter_batch_recommendations([BatchProfile(**profile) for profile in profiles])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="운동 추천 일괄 계산 (NDJSON 출력)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="프로필 파일 (JSON 배열 / NDJSON, '-'는 표준 입력)")
+    source.add_argument("--django-db", help="백엔드 SQLite DB 경로 (accounts_userprofile)")
+    parser.add_argument("--output", default="-", help="결과 NDJSON 파일 (기본: 표준 출력)")
+    parser.add_argument("--url", help="추천 API 주소 (없으면 이 프로세스에서 직접 계산)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="--url 사용 시 요청 한 번에 보낼 프로필 수")
+    args = parser.parse_args()
+
+    if args.input:
+        profiles = read_profiles(args.input)
+    else:
+        profiles = read_django_profiles(os.path.abspath(args.django_db))
+
+    output = sys.stdout if args.output == "-" else open(os.path.abspath(args.output), "w", encoding="utf-8")
+    if args.url:
+        lines = stream_remote(args.url, profiles, args.chunk_size)
+    else:
+        lines = stream_local(profiles)
+
+    written = 0
+    start = time.perf_counter()
+    with output:
+        for line in lines:
+            output.write(line)
+            written += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"프로필 {len(profiles)}개 → {written}줄, {elapsed:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# bench_lookup.py
+# 예전 방식(매 요청마다 BMI를 CAST로 계산하며 전체 스캔)과
+# BMI_BAND 인덱스 조회의 속도를 CSV 데이터 / 합성 대용량 데이터로 비교한다.
+#
+#   python bench_lookup.py              # CSV + 합성 100만 행
+#   python bench_lookup.py --rows 200000
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from bmi import LEVELS
+from import_csv import create_schema, insert_rows, read_csv
+
+# 예전 main.py의 조회 (BMI 컬럼/인덱스 없음)
+LEGACY_SCHEMA = """
+CREATE TABLE FITNESS_MEASURE (
+    AGRDE_FLAG_NM        TEXT,
+    SEXDSTN_FLAG_CD      TEXT,
+    MESURE_IEM_001_VALUE TEXT,
+    MESURE_IEM_002_VALUE TEXT,
+    MVM_PRSCPTN_CN       TEXT
+);
+"""
+
+LEGACY_BMI = """
+    CAST(MESURE_IEM_002_VALUE AS REAL) /
+    ((CAST(MESURE_IEM_001_VALUE AS REAL)/100.0) *
+     (CAST(MESURE_IEM_001_VALUE AS REAL)/100.0))
+"""
+
+LEGACY_LOW_SQL = f"""
+SELECT *
+FROM FITNESS_MEASURE
+WHERE AGRDE_FLAG_NM = ?
+  AND SEXDSTN_FLAG_CD = ?
+  AND (({LEGACY_BMI}) < 18.5 OR ({LEGACY_BMI}) >= 25.0)
+"""
+
+LEGACY_RANGE_SQL = f"""
+SELECT *
+FROM FITNESS_MEASURE
+WHERE AGRDE_FLAG_NM = ?
+  AND SEXDSTN_FLAG_CD = ?
+  AND ({LEGACY_BMI}) BETWEEN ? AND ?
+"""
+
+BAND_SQL = """
+SELECT MVM_PRSCPTN_CN
+FROM FITNESS_MEASURE
+WHERE AGRDE_FLAG_NM = ?
+  AND SEXDSTN_FLAG_CD = ?
+  AND BMI_BAND = ?
+"""
+
+
+def legacy_lookup(conn, age_group, sex, level):
+    if level == "하":
+        return conn.execute(LEGACY_LOW_SQL, (age_group, sex)).fetchall()
+    bmi_min, bmi_max = (18.5, 23.0) if level == "상" else (23.0, 25.0)
+    return conn.execute(LEGACY_RANGE_SQL, (age_group, sex, bmi_min, bmi_max)).fetchall()
+
+
+def band_lookup(conn, age_group, sex, level):
+    return conn.execute(BAND_SQL, (age_group, sex, level)).fetchall()
+
+
+def synthetic_rows(source, n, seed=0):
+    """CSV의 (연령대, 성별, 처방) 조합을 뽑고 키/체중은 조금씩 흔들어 n행을 만든다"""
+    rng = random.Random(seed)
+    for _ in range(n):
+        age_group, sex, height, weight, prescription = rng.choice(source)
+        yield (
+            age_group,
+            sex,
+            round(float(height) + rng.gauss(0, 3), 1),
+            round(float(weight) + rng.gauss(0, 4), 1),
+            prescription,
+        )
+
+
+def build(path, rows, legacy):
+    conn = sqlite3.connect(path)
+    if legacy:
+        conn.executescript("DROP TABLE IF EXISTS FITNESS_MEASURE;" + LEGACY_SCHEMA)
+        conn.executemany("INSERT INTO FITNESS_MEASURE VALUES (?, ?, ?, ?, ?)", rows)
+    else:
+        create_schema(conn)
+        insert_rows(conn, rows)
+    conn.commit()
+    return conn
+
+
+def measure(conn, lookup, keys, repeat):
+    """요청 한 번 = 상/중/하 세 번 조회. 요청당 평균 ms와 읽은 행 수"""
+    found = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for age_group, sex in keys:
+            for level in LEVELS:
+                found += len(lookup(conn, age_group, sex, level))
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(keys)) * 1000, found // repeat
+
+
+def run(title, rows, repeat):
+    rows = list(rows)
+    keys = sorted({(r[0], r[1]) for r in rows})
+    print(f"\n== {title}: {len(rows)}행, (연령대, 성별) {len(keys)}쌍 ==")
+
+    tmp = tempfile.mkdtemp()
+    legacy = build(os.path.join(tmp, "legacy.db"), rows, legacy=True)
+    indexed = build(os.path.join(tmp, "indexed.db"), rows, legacy=False)
+    try:
+        age_group, sex = keys[0]
+        for name, conn, sql, params in [
+            ("예전 (CAST 스캔)", legacy, LEGACY_RANGE_SQL, (age_group, sex, 18.5, 23.0)),
+            ("BMI_BAND 인덱스", indexed, BAND_SQL, (age_group, sex, "상")),
+        ]:
+            plan = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+            print(f"  [{name}] " + " / ".join(row[-1] for row in plan))
+
+        legacy_ms, legacy_found = measure(legacy, legacy_lookup, keys, repeat)
+        band_ms, band_found = measure(indexed, band_lookup, keys, repeat)
+        print(f"  예전 (CAST 스캔)  : {legacy_ms:9.3f} ms/요청  (조회 행 {legacy_found})")
+        print(f"  BMI_BAND 인덱스   : {band_ms:9.3f} ms/요청  (조회 행 {band_found})")
+        print(f"  속도 향상: {legacy_ms / band_ms:.1f}배")
+        if legacy_found != band_found:
+            # 예전 BETWEEN은 경계값(BMI 23.0)이 상/중 양쪽에 잡혔다
+            print(f"  ※ 경계값 중복 차이: {legacy_found - band_found}행")
+    finally:
+        legacy.close()
+        indexed.close()
+        for name in os.listdir(tmp):
+            os.remove(os.path.join(tmp, name))
+        os.rmdir(tmp)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="운동 처방 조회 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="합성 데이터 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="CSV 데이터 반복 측정 횟수")
+    args = parser.parse_args()
+
+    source = list(read_csv().itertuples(index=False, name=None))
+    run("FTNESS_MESURE.csv", source, args.repeat)
+    if args.rows:
+        run("합성 데이터", synthetic_rows(source, args.rows), 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# bmi.py
+# BMI 계산과 난이도(상/중/하) 구간 기준. API(main.py)와 임포터(import_csv.py)가 같이 쓴다.
+from typing import Optional
+
+LEVELS = ("상", "중", "하")
+
+# 구간 경계 (하한 포함, 상한 미포함)
+# - 상 : 18.5 <= BMI < 23
+# - 중 : 23 <= BMI < 25
+# - 하 : BMI < 18.5 또는 BMI >= 25
+UNDERWEIGHT_MAX = 18.5
+NORMAL_MAX = 23.0
+OVERWEIGHT_MAX = 25.0
+
+
+def calculate_bmi(height_cm: float, weight_kg: float) -> float:
+    h = height_cm / 100.0
+    return round(weight_kg / (h * h), 2)
+
+
+def classify_difficulty(bmi: float) -> str:
+    if bmi < UNDERWEIGHT_MAX or bmi >= OVERWEIGHT_MAX:
+        return "하"
+    elif NORMAL_MAX <= bmi < OVERWEIGHT_MAX:
+        return "중"
+    else:
+        return "상"
+
+
+def measure_bmi(height, weight) -> Optional[float]:
+    """측정 데이터의 키/몸무게(문자열일 수도 있음) → BMI. 값이 이상하면 None"""
+    try:
+        height_cm = float(height)
+        weight_kg = float(weight)
+    except (TypeError, ValueError):
+        return None
+    if height_cm <= 0 or weight_kg <= 0:
+        return None
+    # 예전 SQL 조건과 같게 반올림하지 않은 값으로 구간을 나눈다
+    h = height_cm / 100.0
+    return weight_kg / (h * h)
@@ -0,0 +1,105 @@
+# db.py
+# 추천 API용 SQLite 읽기 전용 커넥션 풀.
+# FastAPI는 sync 엔드포인트를 스레드풀에서 돌리므로, 요청마다 connect 하지 않고
+# 미리 설정을 마친 커넥션을 스레드끼리 돌려 쓴다.
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# 읽기 전용 커넥션에 거는 설정
+READ_PRAGMAS = (
+    "PRAGMA query_only = ON",
+    "PRAGMA mmap_size = 268435456",   # 256MB까지 메모리 맵으로 읽기
+    "PRAGMA cache_size = -16000",     # 커넥션당 페이지 캐시 약 16MB
+    "PRAGMA temp_store = MEMORY",     # 정렬/윈도우 함수 임시 B-tree를 메모리에
+)
+
+# 커넥션마다 준비된 문장(prepared statement)을 이만큼 재사용
+CACHED_STATEMENTS = 256
+
+
+def connect_readonly(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=ro",
+        uri=True,
+        check_same_thread=False,   # 풀에서 여러 스레드가 번갈아 사용 (동시에 한 스레드만)
+        cached_statements=CACHED_STATEMENTS,
+    )
+    for pragma in READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class ConnectionPool:
+    """
+    최대 size개의 읽기 전용 커넥션을 필요할 때 만들고 돌려 쓴다.
+    모두 사용 중이면 timeout초까지 기다린다. size=0이면 풀 없이 매번 새로 연다 (예전 방식, 비교용).
+    DB가 WAL 모드면 임포트가 커밋되기 전까지 읽는 쪽은 이전 데이터를 그대로 본다.
+    """
+
+    def __init__(self, db_path: str, size: int = 8, timeout: float = 10.0):
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                try:
+                    return connect_readonly(self.db_path)
+                except sqlite3.Error:
+                    self._created -= 1
+                    raise
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError("DB 커넥션 풀이 가득 찼습니다")
+
+    def _release(self, conn: sqlite3.Connection, broken: bool):
+        if broken:
+            conn.close()
+            with self._lock:
+                self._created -= 1
+        else:
+            self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        if self.size <= 0:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        conn = self._acquire()
+        broken = False
+        try:
+            yield conn
+        except sqlite3.DatabaseError:
+            # 파일이 통째로 바뀌는 등 커넥션이 망가졌을 수 있으니 버리고 새로 만든다
+            broken = True
+            raise
+        finally:
+            if not broken and conn.in_transaction:
+                conn.rollback()
+            self._release(conn, broken)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._created -= 1
@@ -1,65 +1,109 @@
 import sqlite3
 import pandas as pd
 
+from bmi import classify_difficulty, measure_bmi
+
 DB_PATH = "fitness.db"
 CSV_PATH = "FTNESS_MESURE.csv"  # 👉 새로 넣은 파일 이름
 
-# 1) CSV 읽기 (인코딩은 상황에 따라 cp949 또는 utf-8-sig)
-#    먼저 utf-8-sig로 시도해보고, 에러 나면 cp949로 바꿔서 다시 실행해봐.
-df = pd.read_csv(CSV_PATH, encoding="utf-8-sig")
-print("컬럼 목록:", df.columns)
-
-# 2) 우리가 사용할 컬럼만 추출
-#    (너가 처음에 올려준 스키마 기준)
+# 우리가 사용할 컬럼 (CSV 기준)
 #    AGRDE_FLAG_NM        연령대구분명
 #    SEXDSTN_FLAG_CD      성별구분코드
 #    MESURE_IEM_001_VALUE 신장(cm)
 #    MESURE_IEM_002_VALUE 체중(kg)
-#    MVM_PRSCRPTN_CN      운동처방내용
-df_small = df[
-    [
-        "AGRDE_FLAG_NM",
-        "SEXDSTN_FLAG_CD",
-        "MESURE_IEM_001_VALUE",
-        "MESURE_IEM_002_VALUE",
-        "MVM_PRSCRPTN_CN",
-    ]
-].copy()
-
-# 3) 핵심 값이 없는 행 제거
-df_small = df_small.dropna(
-    subset=[
-        "AGRDE_FLAG_NM",
-        "SEXDSTN_FLAG_CD",
-        "MESURE_IEM_001_VALUE",
-        "MESURE_IEM_002_VALUE",
-        "MVM_PRSCRPTN_CN",
-    ]
+#    MVM_PRSCRPTN_CN      운동처방내용 (DB 컬럼 이름은 MVM_PRSCPTN_CN)
+CSV_COLUMNS = [
+    "AGRDE_FLAG_NM",
+    "SEXDSTN_FLAG_CD",
+    "MESURE_IEM_001_VALUE",
+    "MESURE_IEM_002_VALUE",
+    "MVM_PRSCRPTN_CN",
+]
+
+# BMI / BMI_BAND는 임포트할 때 한 번만 계산해 두고,
+# 조회는 (연령대, 성별, 구간) 인덱스 범위 읽기로 끝낸다.
+SCHEMA = (
+    "DROP TABLE IF EXISTS FITNESS_MEASURE",
+    """
+    CREATE TABLE FITNESS_MEASURE (
+        AGRDE_FLAG_NM        TEXT,
+        SEXDSTN_FLAG_CD      TEXT,
+        MESURE_IEM_001_VALUE TEXT,
+        MESURE_IEM_002_VALUE TEXT,
+        MVM_PRSCPTN_CN       TEXT,
+        BMI                  REAL,
+        BMI_BAND             TEXT
+    )
+    """,
+    """
+    CREATE INDEX IDX_FITNESS_MEASURE_LOOKUP
+        ON FITNESS_MEASURE (AGRDE_FLAG_NM, SEXDSTN_FLAG_CD, BMI_BAND)
+    """,
 )
 
-print("사용할 행 수:", len(df_small))
+INSERT_SQL = """
+INSERT INTO FITNESS_MEASURE
+(AGRDE_FLAG_NM, SEXDSTN_FLAG_CD,
+ MESURE_IEM_001_VALUE, MESURE_IEM_002_VALUE, MVM_PRSCPTN_CN,
+ BMI, BMI_BAND)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def with_bmi(row):
+    """(연령대, 성별, 키, 체중, 처방) → BMI, BMI_BAND를 붙인 행"""
+    bmi = measure_bmi(row[2], row[3])
+    band = classify_difficulty(bmi) if bmi is not None else None
+    return (*row, bmi, band)
+
+
+def create_schema(conn):
+    """FITNESS_MEASURE를 새 스키마로 다시 만든다 (기존 데이터 삭제)"""
+    for sql in SCHEMA:
+        conn.execute(sql)
 
-# 4) DB 연결
-conn = sqlite3.connect(DB_PATH)
-cur = conn.cursor()
 
-# 기존 데이터 싹 지우고 새로 채우고 싶으면:
-cur.execute("DELETE FROM FITNESS_MEASURE;")
+def insert_rows(conn, rows):
+    conn.executemany(INSERT_SQL, (with_bmi(row) for row in rows))
 
-# 5) INSERT
-rows = df_small.itertuples(index=False, name=None)
 
-cur.executemany(
+def refresh(conn, rows):
     """
-    INSERT INTO FITNESS_MEASURE
-    (AGRDE_FLAG_NM, SEXDSTN_FLAG_CD,
-     MESURE_IEM_001_VALUE, MESURE_IEM_002_VALUE, MVM_PRSCRPTN_CN)
-    VALUES (?, ?, ?, ?, ?)
-    """,
-    rows,
-)
+    테이블을 다시 만들고 채우는 작업을 트랜잭션 하나로 처리한다.
+    WAL 모드라 API는 커밋 전까지 이전 데이터를 계속 읽고, 커밋하는 순간 새 데이터로 넘어간다.
+    (conn은 isolation_level=None으로 열어야 BEGIN/COMMIT을 직접 다룰 수 있다)
+    """
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        create_schema(conn)
+        insert_rows(conn, rows)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def read_csv(csv_path=CSV_PATH):
+    # 인코딩은 상황에 따라 cp949 또는 utf-8-sig
+    df = pd.read_csv(csv_path, encoding="utf-8-sig")
+    print("컬럼 목록:", df.columns)
+
+    # 핵심 값이 없는 행 제거
+    df_small = df[CSV_COLUMNS].dropna(subset=CSV_COLUMNS)
+    print("사용할 행 수:", len(df_small))
+    return df_small
+
+
+def main():
+    df_small = read_csv()
+
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    refresh(conn, df_small.itertuples(index=False, name=None))
+    conn.close()
+
+    print("DB 삽입 완료! 총", len(df_small), "행 입력")
 
-conn.commit()
-conn.close()
 
-print("DB 삽입 완료! 총", len(df_small), "행 입력")
+if __name__ == "__main__":
+    main()
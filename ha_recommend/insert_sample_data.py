@@ -1,9 +1,10 @@
 # insert_sample_data.py
 import sqlite3
 
+from import_csv import insert_rows
+
 # fitness.db에 연결 (같은 폴더에 있어야 함)
 conn = sqlite3.connect("fitness.db")
-cur = conn.cursor()
 
 # 샘플 데이터 몇 개 (연령대, 성별, 키, 체중, 운동처방내용)
 rows = [
@@ -26,11 +27,8 @@ rows = [
      "걷기, 실내 자전거 위주의 저강도 유산소를 주 5회 진행해 체중을 관리하세요.")
 ]
 
-cur.executemany("""
-INSERT INTO FITNESS_MEASURE
-(AGRDE_FLAG_NM, SEXDSTN_FLAG_CD, MESURE_IEM_001_VALUE, MESURE_IEM_002_VALUE, MVM_PRSCPTN_CN)
-VALUES (?, ?, ?, ?, ?);
-""", rows)
+# BMI / BMI_BAND도 함께 계산해서 넣는다
+insert_rows(conn, rows)
 
 conn.commit()
 conn.close()
@@ -0,0 +1,161 @@
+# load_test.py
+# 추천 API를 설정별로 띄워 놓고 동시 클라이언트로 요청을 보내 처리량/지연 시간을 비교한다.
+#
+#   python load_test.py                       # 기본: 동시 32, 시나리오당 2000건
+#   python load_test.py --concurrency 64 --requests 5000
+#   python load_test.py --reimport            # 부하 중에 import_csv.refresh를 계속 실행
+import argparse
+import asyncio
+import os
+import random
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+import httpx
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(HERE, "fitness.db")
+
+SCENARIOS = [
+    ("SQL, 요청마다 연결 (풀 없음)", {"PRESCRIPTION_SOURCE": "sql", "DB_POOL_SIZE": "0"}),
+    ("SQL, 커넥션 풀", {"PRESCRIPTION_SOURCE": "sql", "DB_POOL_SIZE": "8"}),
+    ("메모리 인덱스", {"PRESCRIPTION_SOURCE": "memory"}),
+]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(env, port):
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=HERE,
+        env={**os.environ, **env},
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return proc
+        except httpx.TransportError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("서버가 뜨지 않았습니다")
+
+
+def request_bodies(n, seed=0):
+    conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+    keys = conn.execute("SELECT DISTINCT AGRDE_FLAG_NM, SEXDSTN_FLAG_CD FROM FITNESS_MEASURE").fetchall()
+    conn.close()
+
+    rng = random.Random(seed)
+    bodies = []
+    for _ in range(n):
+        age_group, sex = rng.choice(keys)
+        bodies.append({
+            "ageGroup": age_group,
+            "sex": sex,
+            "heightCm": round(rng.uniform(140, 190), 1),
+            "weightKg": round(rng.uniform(40, 100), 1),
+        })
+    return bodies
+
+
+async def run_clients(url, bodies, concurrency):
+    latencies, errors = [], 0
+    queue = list(reversed(bodies))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal errors
+            while queue:
+                body = queue.pop()
+                start = time.perf_counter()
+                try:
+                    response = await client.post("/recommendations", json=body)
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+
+def reimport_loop(stop, counter):
+    """부하가 걸린 동안 CSV를 다시 임포트한다 (읽기가 끊기지 않는지 확인)"""
+    sys.path.insert(0, HERE)
+    from import_csv import read_csv, refresh
+
+    rows = list(read_csv().itertuples(index=False, name=None))
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, timeout=30)
+    try:
+        while not stop.is_set():
+            refresh(conn, rows)
+            counter.append(1)
+    finally:
+        conn.close()
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추천 API 부하 테스트")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오당 요청 수")
+    parser.add_argument("--reimport", action="store_true", help="부하 중에 데이터 다시 임포트")
+    args = parser.parse_args()
+
+    bodies = request_bodies(args.requests)
+    results = []
+    for title, env in SCENARIOS:
+        port = free_port()
+        proc = start_server(env, port)
+        stop, reimports = threading.Event(), []
+        importer = None
+        if args.reimport:
+            importer = threading.Thread(target=reimport_loop, args=(stop, reimports))
+            importer.start()
+        try:
+            latencies, errors, elapsed = asyncio.run(
+                run_clients(f"http://127.0.0.1:{port}", bodies, args.concurrency)
+            )
+        finally:
+            stop.set()
+            if importer:
+                importer.join()
+            proc.terminate()
+            proc.wait()
+
+        rps = len(latencies) / elapsed
+        results.append((title, rps))
+        print(f"\n== {title} ==")
+        print(f"  처리량 {rps:8.1f} req/s, 오류 {errors}건")
+        if latencies:
+            print(f"  지연 p50 {percentile(latencies, 0.5) * 1000:.1f} ms, "
+                  f"p95 {percentile(latencies, 0.95) * 1000:.1f} ms")
+        if args.reimport:
+            print(f"  부하 중 다시 임포트: {len(reimports)}회")
+
+    base = results[0][1]
+    print("\n요약 (동시 {}명)".format(args.concurrency))
+    for title, rps in results:
+        print(f"  {title:<22}: {rps:8.1f} req/s ({rps / base:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,40 @@
 # main.py
+from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List
-import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import json
+import os
+
+from bmi import LEVELS, calculate_bmi, classify_difficulty
+from db import ConnectionPool
+from prescriptions import PrescriptionIndex
 
 DB_PATH = "fitness.db"
 
-app = FastAPI(title="Exercise Recommendation API")
+# memory: 시작할 때 읽어 둔 처방 인덱스 사용 (DB 파일이 바뀌면 다시 읽음)
+# sql   : 요청마다 DB 조회 (예전 방식)
+PRESCRIPTION_SOURCE = os.getenv("PRESCRIPTION_SOURCE", "memory")
+
+# 읽기 전용 커넥션 풀 크기 (0이면 요청마다 새로 연결)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+
+prescription_index = PrescriptionIndex(DB_PATH)
+db_pool = ConnectionPool(DB_PATH, size=DB_POOL_SIZE)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if PRESCRIPTION_SOURCE == "memory":
+        prescription_index.load()
+    yield
+    db_pool.close()
+
+
+app = FastAPI(title="Exercise Recommendation API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -20,18 +46,13 @@ app.add_middleware(
 
 
 
-# ---------- DB 연결 ----------
-def get_connection():
-    return sqlite3.connect(DB_PATH)
-
-
 # ---------- 요청/응답 모델 ----------
 
 class RecommendationRequest(BaseModel):
     ageGroup: str = Field(..., description="연령대 (예: '20대', '30대')")
     sex: str = Field(..., description="성별 코드 (예: 'M', 'F')")
-    heightCm: float
-    weightKg: float
+    heightCm: float = Field(..., gt=0, description="키 (cm)")
+    weightKg: float = Field(..., gt=0, description="몸무게 (kg)")
 
 
 class RecommendationLevel(BaseModel):
@@ -45,103 +66,115 @@ class RecommendationResponse(BaseModel):
     recommendations: List[RecommendationLevel]
 
 
-# ---------- BMI 계산 & 난이도 분류 ----------
-
-def calculate_bmi(height_cm: float, weight_kg: float) -> float:
-    h = height_cm / 100.0
-    return round(weight_kg / (h * h), 2)
+class BatchProfile(RecommendationRequest):
+    id: Optional[Union[int, str]] = None   # 호출한 쪽의 사용자 식별자 (그대로 돌려줌)
 
 
-def classify_difficulty(bmi: float) -> str:
-    """
-    예시 기준:
-    - 하 : BMI < 18.5 또는 BMI >= 25
-    - 중 : 23 <= BMI < 25
-    - 상 : 18.5 <= BMI < 23
-    """
-    if bmi < 18.5 or bmi >= 25:
-        return "하"
-    elif 23 <= bmi < 25:
-        return "중"
-    else:
-        return "상"
+class BatchRecommendationRequest(BaseModel):
+    profiles: List[BatchProfile]
 
 
 # ---------- 난이도별 운동 처방 조회 ----------
 
-def fetch_prescriptions_for_level(
+# 데이터가 없을 때 쓰는 기본 문구
+DEFAULT_PRESCRIPTIONS = {
+    "상": "유산소와 근력운동을 함께 진행해 전신 체력을 향상시키세요.",
+    "중": "빠른 걷기와 가벼운 조깅을 주 3~4회 실천해 보세요.",
+    "하": "걷기, 실내 자전거 등 저충격 유산소 운동을 꾸준히 해주세요.",
+}
+
+# 상/중/하 세 구간을 쿼리 한 번으로 조회하고 요일 로테이션까지 SQL에서 처리한다.
+# - counts : 구간별 행 수 n (GROUP BY)
+# - ranked : 구간 안에서 rowid 순서 번호 pos (ROW_NUMBER 윈도우 함수)
+# - slotted: 오늘 시작 위치 start = (weekday * limit) % n 부터 몇 번째인지 (rotate_prescriptions와 같은 계산)
+# 처방이 없는 행은 메모리 인덱스(prescriptions.LOAD_SQL)와 같게 n과 순서 번호 계산에서부터 뺀다.
+PRESCRIPTIONS_SQL = """
+WITH counts AS (
+    SELECT BMI_BAND, COUNT(*) AS n
+    FROM FITNESS_MEASURE
+    WHERE AGRDE_FLAG_NM = :age_group
+      AND SEXDSTN_FLAG_CD = :sex
+      AND BMI_BAND IS NOT NULL
+      AND MVM_PRSCPTN_CN IS NOT NULL
+    GROUP BY BMI_BAND
+),
+ranked AS (
+    SELECT rowid AS rid,
+           BMI_BAND,
+           ROW_NUMBER() OVER (PARTITION BY BMI_BAND ORDER BY rowid) - 1 AS pos
+    FROM FITNESS_MEASURE
+    WHERE AGRDE_FLAG_NM = :age_group
+      AND SEXDSTN_FLAG_CD = :sex
+      AND BMI_BAND IS NOT NULL
+      AND MVM_PRSCPTN_CN IS NOT NULL
+),
+slotted AS (
+    SELECT ranked.rid,
+           ranked.BMI_BAND,
+           CASE
+               WHEN counts.n <= :limit THEN ranked.pos
+               ELSE ((ranked.pos - (:weekday * :limit) % counts.n) % counts.n + counts.n) % counts.n
+           END AS slot
+    FROM ranked
+    JOIN counts ON counts.BMI_BAND = ranked.BMI_BAND
+)
+SELECT slotted.BMI_BAND, FITNESS_MEASURE.MVM_PRSCPTN_CN
+FROM slotted
+JOIN FITNESS_MEASURE ON FITNESS_MEASURE.rowid = slotted.rid
+WHERE slotted.slot < :limit
+ORDER BY slotted.BMI_BAND, slotted.slot
+"""
+
+
+def fetch_prescriptions(
     age_group: str,
     sex: str,
-    level: str,
     limit: int = 3,
-) -> List[str]:
+    weekday: Optional[int] = None,
+) -> Dict[str, List[str]]:
     """
-    연령대 + 성별 + BMI 구간 기준으로 행을 고르고,
+    연령대 + 성별 기준으로 BMI 구간(상/중/하)별 처방을 고르고,
     '오늘 요일'에 따라 매일 다른 처방 세트를 돌려준다.
     - 월~일: weekday 0~6
     """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # BMI = 체중(kg) / (키(m)^2)
-    if level == "하":
-        sql = """
-        SELECT *
-        FROM FITNESS_MEASURE
-        WHERE AGRDE_FLAG_NM = ?
-          AND SEXDSTN_FLAG_CD = ?
-          AND (
-            (CAST(MESURE_IEM_002_VALUE AS REAL) /
-             ((CAST(MESURE_IEM_001_VALUE AS REAL)/100.0) *
-              (CAST(MESURE_IEM_001_VALUE AS REAL)/100.0)) < 18.5)
-            OR
-            (CAST(MESURE_IEM_002_VALUE AS REAL) /
-             ((CAST(MESURE_IEM_001_VALUE AS REAL)/100.0) *
-              (CAST(MESURE_IEM_001_VALUE AS REAL)/100.0)) >= 25.0)
-          )
-        """
-        cur.execute(sql, (age_group, sex))
+    if weekday is None:
+        weekday = datetime.now().weekday()  # 0=월, 6=일
+
+    if PRESCRIPTION_SOURCE == "sql":
+        picked = query_prescriptions(age_group, sex, limit, weekday)
     else:
-        if level == "상":
-            bmi_min, bmi_max = 18.5, 23.0
-        else:  # "중"
-            bmi_min, bmi_max = 23.0, 25.0
-
-        sql = """
-        SELECT *
-        FROM FITNESS_MEASURE
-        WHERE AGRDE_FLAG_NM = ?
-          AND SEXDSTN_FLAG_CD = ?
-          AND (
-            CAST(MESURE_IEM_002_VALUE AS REAL) /
-            ((CAST(MESURE_IEM_001_VALUE AS REAL)/100.0) *
-             (CAST(MESURE_IEM_001_VALUE AS REAL)/100.0))
-          ) BETWEEN ? AND ?
-        """
-        cur.execute(sql, (age_group, sex, bmi_min, bmi_max))
-
-    rows = cur.fetchall()
-    conn.close()
-
-    # 각 행의 마지막 컬럼을 '운동처방내용'으로 사용
-    all_pres = [r[-1] for r in rows if r and r[-1] is not None]
+        picked = {
+            level: rotate_prescriptions(prescription_index.get(age_group, sex, level), limit, weekday)
+            for level in LEVELS
+        }
 
     # 데이터가 거의 없으면 기존 기본 문구 사용
-    if not all_pres:
-        if level == "상":
-            return ["유산소와 근력운동을 함께 진행해 전신 체력을 향상시키세요."]
-        elif level == "중":
-            return ["빠른 걷기와 가벼운 조깅을 주 3~4회 실천해 보세요."]
-        else:
-            return ["걷기, 실내 자전거 등 저충격 유산소 운동을 꾸준히 해주세요."]
-
-    # 🔹 요일 기준 로테이션: 월(0)~일(6)
-    weekday = datetime.now().weekday()  # 0=월, 6=일
+    return {level: picked.get(level) or [DEFAULT_PRESCRIPTIONS[level]] for level in LEVELS}
+
+
+def query_prescriptions(age_group: str, sex: str, limit: int, weekday: int) -> Dict[str, List[str]]:
+    """DB에서 세 구간을 쿼리 한 번으로 조회 (PRESCRIPTION_SOURCE=sql)"""
+    with db_pool.connection() as conn:
+        rows = conn.execute(PRESCRIPTIONS_SQL, {
+            "age_group": age_group,
+            "sex": sex,
+            "limit": limit,
+            "weekday": weekday,
+        }).fetchall()
+
+    picked: Dict[str, List[str]] = {}
+    for band, prescription in rows:
+        picked.setdefault(band, []).append(prescription)
+    return picked
+
+
+def rotate_prescriptions(all_pres: Sequence[str], limit: int, weekday: int) -> List[str]:
+    """요일 기준 로테이션: 월(0)~일(6)"""
     n = len(all_pres)
 
     if n <= limit:
         # 후보가 적으면 그냥 다 보여줌
-        return all_pres
+        return list(all_pres)
 
     # 오늘 요일에 따라 시작 위치 결정
     start = (weekday * limit) % n
@@ -154,7 +187,6 @@ def fetch_prescriptions_for_level(
     return selected
 
 
-
 # ---------- 헬스 체크 ----------
 @app.get("/health")
 def health():
@@ -170,20 +202,16 @@ def get_recommendations(req: RecommendationRequest):
     # 2) 난이도 분류
     diff = classify_difficulty(bmi)
 
-    # 3) 난이도 상/중/하 각각에 대해 처방 가져오기
-    levels = ["상", "중", "하"]
-    result_levels: List[RecommendationLevel] = []
-
-    for lv in levels:
-        pres = fetch_prescriptions_for_level(
-            age_group=req.ageGroup,
-            sex=req.sex,
-            level=lv,
-            limit=3,
-        )
-        result_levels.append(
-            RecommendationLevel(level=lv, prescriptions=pres)
-        )
+    # 3) 난이도 상/중/하 처방을 한 번에 가져오기
+    prescriptions = fetch_prescriptions(
+        age_group=req.ageGroup,
+        sex=req.sex,
+        limit=3,
+    )
+    result_levels = [
+        RecommendationLevel(level=lv, prescriptions=prescriptions[lv])
+        for lv in LEVELS
+    ]
 
     # 4) BMI + 사용자 난이도 + 난이도별 처방 리스트 반환
     return RecommendationResponse(
@@ -191,3 +219,53 @@ def get_recommendations(req: RecommendationRequest):
         difficulty=diff,
         recommendations=result_levels,
     )
+
+
+# ---------- 일괄 추천 API ----------
+
+def iter_batch_recommendations(profiles: Iterable[BatchProfile], limit: int = 3) -> Iterator[str]:
+    """
+    프로필마다 NDJSON 한 줄씩 만든다 (입력 순서, index = 입력 위치).
+    처방은 (연령대, 성별)마다 한 번만 조회하고, "difficulty"/"recommendations" 부분의 JSON은
+    (연령대, 성별, BMI 구간)마다 한 번만 만들어 두고 프로필별 값(index, id, bmi)만 붙인다.
+    요일은 배치 시작 시점 기준으로 고정한다.
+    """
+    weekday = datetime.now().weekday()
+    prescriptions: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+    fragments: Dict[Tuple[str, str, str], str] = {}
+
+    for index, profile in enumerate(profiles):
+        head = {"index": index, "id": profile.id}
+        bmi = calculate_bmi(profile.heightCm, profile.weightKg)
+        diff = classify_difficulty(bmi)
+
+        key = (profile.ageGroup, profile.sex, diff)
+        fragment = fragments.get(key)
+        if fragment is None:
+            group = (profile.ageGroup, profile.sex)
+            if group not in prescriptions:
+                prescriptions[group] = fetch_prescriptions(*group, limit=limit, weekday=weekday)
+            body = {
+                "difficulty": diff,
+                "recommendations": [
+                    {"level": lv, "prescriptions": prescriptions[group][lv]} for lv in LEVELS
+                ],
+            }
+            # 바깥 중괄호를 뗀 '"difficulty": ..., "recommendations": [...]' 부분
+            fragment = fragments[key] = json.dumps(body, ensure_ascii=False)[1:-1]
+
+        head["bmi"] = bmi
+        yield json.dumps(head, ensure_ascii=False)[:-1] + ", " + fragment + "}\n"
+
+
+@app.post("/recommendations/batch")
+def get_batch_recommendations(req: BatchRecommendationRequest):
+    """
+    여러 프로필의 추천을 한 번에 계산해 NDJSON으로 흘려보낸다.
+    각 줄은 {"index", "id", "bmi", "difficulty", "recommendations"} (/recommendations 응답 + index/id).
+    키/몸무게가 0 이하인 프로필이 있으면 /recommendations와 같이 422로 요청 전체를 거절한다.
+    """
+    return StreamingResponse(
+        iter_batch_recommendations(req.profiles),
+        media_type="application/x-ndjson",
+    )
@@ -0,0 +1,91 @@
+# prescriptions.py
+# FITNESS_MEASURE를 (연령대, 성별, BMI 구간)별 처방 목록으로 메모리에 올려 두는 인덱스.
+# 요청마다 DB를 열지 않고 dict 조회 한 번으로 후보 목록을 얻는다.
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Key = Tuple[str, str, str]  # (연령대, 성별, BMI_BAND)
+
+LOAD_SQL = """
+SELECT AGRDE_FLAG_NM, SEXDSTN_FLAG_CD, BMI_BAND, MVM_PRSCPTN_CN
+FROM FITNESS_MEASURE
+WHERE BMI_BAND IS NOT NULL
+  AND MVM_PRSCPTN_CN IS NOT NULL
+ORDER BY rowid
+"""
+
+
+def file_stamp(db_path: str) -> Optional[tuple]:
+    """DB 파일(+ WAL 파일)의 수정 시각/크기. 파일이 없으면 None"""
+    stamp = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            if path == db_path:
+                return None
+            continue
+        stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+def load_groups(db_path: str) -> Dict[Key, Tuple[str, ...]]:
+    """
+    (연령대, 성별, 구간) → 처방 문자열 튜플.
+    순서는 DB 행 순서(rowid)와 같고, 같은 처방 문구는 sys.intern으로 한 객체만 둔다.
+    """
+    groups = defaultdict(list)
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        for age_group, sex, band, prescription in conn.execute(LOAD_SQL):
+            key = (sys.intern(age_group), sys.intern(sex), sys.intern(band))
+            groups[key].append(sys.intern(prescription))
+    finally:
+        conn.close()
+    return {key: tuple(items) for key, items in groups.items()}
+
+
+class PrescriptionIndex:
+    """
+    메모리 처방 인덱스. get()할 때 DB 파일이 바뀌었으면(임포트 다시 실행 등) 새로 읽어서 통째로 바꾼다.
+    읽는 쪽은 dict 참조 하나만 보므로 교체 중에도 잠금 없이 조회할 수 있다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._groups: Dict[Key, Tuple[str, ...]] = {}
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        stamp = file_stamp(self.db_path)
+        groups = load_groups(self.db_path)
+        self._groups, self._stamp = groups, stamp
+        logger.info("처방 인덱스 로드: %d개 그룹, %d행", len(groups), sum(map(len, groups.values())))
+
+    def reload_if_changed(self):
+        stamp = file_stamp(self.db_path)
+        if stamp is None or stamp == self._stamp:
+            return
+        with self._lock:
+            stamp = file_stamp(self.db_path)
+            if stamp is None or stamp == self._stamp:
+                return  # 다른 스레드가 이미 다시 읽음
+            try:
+                self.load()
+            except sqlite3.Error as e:
+                # 임포트 도중이거나 스키마가 예전 것이면 기존 데이터를 계속 쓰고,
+                # 파일이 다시 바뀔 때까지는 재시도하지 않는다
+                self._stamp = stamp
+                logger.warning("처방 인덱스 다시 읽기 실패, 기존 데이터 사용: %s", e)
+
+    def get(self, age_group: str, sex: str, band: str) -> Tuple[str, ...]:
+        self.reload_if_changed()
+        return self._groups.get((age_group, sex, band), ())